@@ -0,0 +1 @@
+"""Benchmarks of the hot paths of the 21energy Heater Control integration."""
@@ -0,0 +1,103 @@
+"""Cost of resolving the miners of all 21PORT per-miner entities in one refresh.
+
+Each miner has seven entities, and each entity resolves its miner for its
+value and for its availability. The coordinator diffs the device list once
+and resolves through its id index. The script compares that with the linear
+scan over the device list that each lookup did before. With the index, the
+cost per miner stays flat as the fleet grows; with the scan, it grows with
+the fleet.
+
+It imports the integration, so Home Assistant must be installed (see
+requirements_test.txt):
+
+    python -m benchmarks.fleet_update [--sizes 25 50 100 200 400]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from tests import integration_module
+
+coordinator_module = integration_module("coordinator")
+lifecycle_module = integration_module("lifecycle")
+
+ENTITIES_PER_MINER = 7
+LOOKUPS_PER_REFRESH = ENTITIES_PER_MINER * 2
+
+
+class _Coordinator:
+    """The part of the coordinator a refresh of the per-miner entities touches."""
+
+    get_device = coordinator_module.HeaterControlDataUpdateCoordinator.get_device
+    _get_device_index = coordinator_module.HeaterControlDataUpdateCoordinator._get_device_index
+
+    def __init__(self) -> None:
+        self.data: dict | None = None
+        self._indexed_devices: list[dict] | None = None
+        self._device_index: dict[str, dict] = {}
+        self.device_lifecycle = lifecycle_module.DeviceLifecycle()
+
+
+def _devices(count: int, refresh: int) -> list[dict]:
+    return [
+        {
+            "id": f"miner-{index}",
+            "model": "Antminer S19",
+            "enabled": True,
+            "powerLevel": 2,
+            "hashrateThs": 95.0 + (index + refresh) % 5,
+            "powerConsumptionW": 3050 + (index + refresh) % 11,
+            "chipTemperature": 70 + (index + refresh) % 3,
+            "poolStatus": "Alive",
+        }
+        for index in range(count)
+    ]
+
+
+def _scan(data: dict | None, device_id: str) -> dict | None:
+    """The lookup of the per-miner entities before the id index."""
+    devices = (data or {}).get("devices") or []
+    return next((d for d in devices if d["id"] == device_id), None)
+
+
+def _refresh_indexed(coordinator: _Coordinator, devices: list[dict]) -> None:
+    coordinator.device_lifecycle.process(coordinator._get_device_index(), devices)
+    coordinator.data = {"devices": devices}
+    for device in devices:
+        for _ in range(LOOKUPS_PER_REFRESH):
+            coordinator.get_device(device["id"])
+
+
+def _refresh_scan(coordinator: _Coordinator, devices: list[dict]) -> None:
+    coordinator.data = {"devices": devices}
+    for device in devices:
+        for _ in range(LOOKUPS_PER_REFRESH):
+            _scan(coordinator.data, device["id"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 50, 100, 200, 400])
+    parser.add_argument("--refreshes", type=int, default=20, help="refreshes per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings, the best one counts")
+    args = parser.parse_args()
+
+    print(f"{'miners':>6} {'lookup':<7} {'ms/refresh':>10} {'us/miner':>9}")
+    for size in args.sizes:
+        # alternate between two device lists, so every refresh sees changes
+        snapshots = [_devices(size, refresh) for refresh in range(2)]
+        for label, refresh in (("index", _refresh_indexed), ("scan", _refresh_scan)):
+            coordinator = _Coordinator()
+
+            def run(coordinator=coordinator, refresh=refresh) -> None:
+                for number in range(args.refreshes):
+                    refresh(coordinator, snapshots[number % 2])
+
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat)) / args.refreshes
+            print(f"{size:>6} {label:<7} {best * 1e3:>10.3f} {best / size * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Time to import the integration and the platform modules of each device type.
+
+Every run imports in a fresh interpreter, after the Home Assistant modules
+the integration builds on, so only the integration's own modules count. The
+package with its root platform modules is what every install loads; the
+21control and 21PORT platform modules are only loaded for a configured
+device of that type, in the executor.
+
+It imports the integration, so Home Assistant must be installed (see
+requirements_test.txt):
+
+    python -m benchmarks.import_time [--runs 11]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from tests import PACKAGE
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# loaded by Home Assistant before any integration; not part of the measurement
+PRELOAD = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.number",
+    "homeassistant.components.sensor",
+    "homeassistant.components.switch",
+)
+PLATFORMS = ("sensor", "binary_sensor", "switch", "number")
+DEVICE_TYPES = {"21control": "ofen", "21PORT": "port"}
+
+RUN = """
+import importlib, json, sys, time
+for name in {preload!r}:
+    importlib.import_module(name)
+start = time.perf_counter()
+for name in {integration!r}:
+    importlib.import_module(name)
+loaded = time.perf_counter()
+for name in {platforms!r}:
+    importlib.import_module(name)
+done = time.perf_counter()
+json.dump({{"integration": loaded - start, "platforms": done - loaded}}, sys.stdout)
+"""
+
+
+def _run(subpackage: str) -> dict[str, float]:
+    source = RUN.format(
+        preload=PRELOAD,
+        integration=(PACKAGE, *(f"{PACKAGE}.{platform}" for platform in PLATFORMS)),
+        platforms=tuple(f"{PACKAGE}.{subpackage}.{platform}" for platform in PLATFORMS),
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", source], cwd=ROOT, capture_output=True, check=True, text=True
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=11, help="fresh interpreters per device type")
+    args = parser.parse_args()
+
+    print(f"{'device type':<12} {'integration ms':>14} {'platforms ms':>12}")
+    for device_type, subpackage in DEVICE_TYPES.items():
+        runs = [_run(subpackage) for _ in range(args.runs)]
+        integration = statistics.median(run["integration"] for run in runs)
+        platforms = statistics.median(run["platforms"] for run in runs)
+        print(f"{device_type:<12} {integration * 1e3:>14.1f} {platforms * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
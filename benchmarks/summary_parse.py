@@ -0,0 +1,57 @@
+"""Parse time per status summary, field tables against the previous parser.
+
+Runs on the payload fixtures of the tests and needs no Home Assistant:
+
+    python -m benchmarks.summary_parse [--number 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import timeit
+from pathlib import Path
+
+from tests import load_fixture
+from tests.summary_reference import parse_status_summary
+
+ROOT = Path(__file__).resolve().parent.parent
+PAYLOADS = {"v0.3": "summary_v0_3.json", "v0.4": "summary_v0_4.json"}
+
+
+def _load_summary_module():
+    # summary.py only depends on the standard library; load it by path, as
+    # importing the integration package pulls in Home Assistant
+    path = ROOT / "custom_components" / "21energy_heater_control" / "summary.py"
+    spec = importlib.util.spec_from_file_location("summary", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="parses per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings, the best one counts")
+    args = parser.parse_args()
+
+    summary = _load_summary_module()
+
+    def parse_tables(payload: dict) -> dict:
+        # the dispatch of HeaterControlApiClient._parse_status_summary
+        if "forge" in payload:
+            return summary.FORGE_SUMMARY.parse(payload)
+        return summary.LEGACY_SUMMARY.parse(payload)
+
+    print(f"{'payload':<8} {'parser':<10} {'us/parse':>9}")
+    for name, fixture in PAYLOADS.items():
+        payload = load_fixture(fixture)
+        for label, parse in (("tables", parse_tables), ("previous", parse_status_summary)):
+            best = min(
+                timeit.repeat(lambda: parse(payload), number=args.number, repeat=args.repeat)
+            )
+            print(f"{name:<8} {label:<10} {best / args.number * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
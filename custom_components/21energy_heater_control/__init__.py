@@ -5,17 +5,20 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-from homeassistant.const import Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.helpers import config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
 from .const import DOMAIN, CONF_POLLING_INTERVAL, LOGGER
 from .coordinator import HeaterControlDataUpdateCoordinator
 from .data import HeaterControlData
 from .device_registry import create_client
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import HeaterControlConfigEntry
 
@@ -26,6 +29,14 @@ PLATFORMS: list[Platform] = [
     Platform.NUMBER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services of the integration."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -33,6 +44,9 @@ async def async_setup_entry(
     entry: HeaterControlConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    scheduler = async_get_scheduler(hass)
+    scheduler.async_register(entry.entry_id)
+    entry.async_on_unload(lambda: scheduler.async_unregister(entry.entry_id))
     coordinator = HeaterControlDataUpdateCoordinator(
         hass=hass,
         entry=entry,
@@ -40,16 +54,35 @@ async def async_setup_entry(
         name=DOMAIN,
         update_interval=timedelta(seconds=entry.data[CONF_POLLING_INTERVAL]),
     )
+    client = create_client(entry.data, limiter=scheduler.limiter)
+    # The client owns its connection pool. Unload callbacks also run when the
+    # setup fails, e.g. to retry later, but not when Home Assistant stops.
+    entry.async_on_unload(client.async_close)
+
+    async def _async_close_client(_event: Event) -> None:
+        await client.async_close()
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEASSISTANT_CLOSE, _async_close_client))
     entry.runtime_data = HeaterControlData(
-        client=create_client(entry.data, async_get_clientsession(hass)),
+        client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
 
-    # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await coordinator.energy.async_load()
+
+    if (snapshot := await coordinator.snapshot.async_load()) is not None:
+        # Set up the entities from the last known data right away and fetch
+        # the live data in the background.
+        coordinator.async_restore(snapshot)
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.entry_id}"
+        )
+    else:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -60,7 +93,11 @@ async def async_unload_entry(
     entry: HeaterControlConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.coordinator.energy.async_save()
+        await entry.runtime_data.coordinator.snapshot.async_save()
+    return unload_ok
 
 
 async def async_reload_entry(
@@ -68,5 +105,4 @@ async def async_reload_entry(
     entry: HeaterControlConfigEntry,
 ) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
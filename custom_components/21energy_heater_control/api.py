@@ -3,47 +3,45 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import re
-import socket
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Iterable
 from typing import Any
 
 import aiohttp
 
+from .commands import CommandCoalescer
 from .const import LOGGER
-
-
-class HeaterControlApiClientError(Exception):
-    """Exception to indicate a general API error."""
-
-
-class HeaterControlApiClientCommunicationError(
+from .summary import FORGE_SUMMARY, LEGACY_SUMMARY
+from .transport import (  # noqa: F401 re-exported for the rest of the integration
+    MAX_CONCURRENT_REQUESTS_PER_HOST,
+    DeviceTransport,
+    HeaterControlApiClientAuthenticationError,
+    HeaterControlApiClientCommunicationError,
     HeaterControlApiClientError,
-):
-    """Exception to indicate a communication error."""
+    HeaterControlApiClientOutdatedError,
+    HeaterControlApiClientUnavailableError,
+)
 
+# Miners written to concurrently by a bulk command
+BULK_COMMAND_CONCURRENCY = MAX_CONCURRENT_REQUESTS_PER_HOST
 
-class HeaterControlApiClientAuthenticationError(
-    HeaterControlApiClientError,
-):
-    """Exception to indicate an authentication error."""
 
-class HeaterControlApiClientOutdatedError(
-    HeaterControlApiClientError,
-):
-    """Exception to indicate that an expected endpoint is not available. Most likely due to the ofen being outdated."""
+async def _gather(*aws: Awaitable[Any]) -> list[Any]:
+    """Await aws concurrently like asyncio.gather, but fail as a whole.
 
-
-def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
-    """Verify that the response is valid."""
-    if response.status in (401, 403):
-        msg = "Invalid credentials"
-        raise HeaterControlApiClientAuthenticationError(
-            msg,
-        )
-    elif response.status == 404:
-        raise HeaterControlApiClientOutdatedError()
-    response.raise_for_status()
+    When one of them raises, the others are cancelled and awaited before the
+    exception propagates, so none keeps running unobserved.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 def pick(primary: str, fallback: str, source: dict):
@@ -69,9 +67,22 @@ class DeviceApiClientBase(ABC):
     @abstractmethod
     async def async_get_data(self) -> dict: ...
 
+    @abstractmethod
+    async def async_get_control_data(self) -> dict:
+        """Get only the control-state fields of async_get_data, as cheaply as possible."""
+
     @abstractmethod
     async def async_set_enable(self, value: bool) -> None: ...
 
+    transport: DeviceTransport
+
+    commands: CommandCoalescer
+
+    async def async_close(self) -> None:
+        """Drop queued writes and release the connections held by the client."""
+        self.commands.cancel()
+        await self.transport.async_close()
+
 
 class HeaterControlApiClient(DeviceApiClientBase):
     """API Client."""
@@ -79,209 +90,158 @@ class HeaterControlApiClient(DeviceApiClientBase):
     def __init__(
         self,
         host: str,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        limiter: contextlib.AbstractAsyncContextManager[Any] | None = None,
     ) -> None:
         """API Client."""
         self._host = host
-        self._session = session
+        self.transport = DeviceTransport(host, "21control", session, cache_ttls, limiter=limiter)
+        self.commands = CommandCoalescer()
+        self._last_summary: Any = None
+        self._last_summary_data: dict = {}
+        self._last_data: dict | None = None
+        self._last_control: dict | None = None
         self._data = {}
 
     async def async_get_data(self) -> Any:
-        """Get all data from the API."""
-        data = {}
-        data["status"] = await self.async_get_status()
-        data["fanspeed"] = int(float(await self._async_get_value("heater/status/fan")))
-        data["powertarget"] = await self._async_get_value("heater/powerTarget")
-        raw_watt = await self._async_get_value("heater/powerTarget/watt")
-        try:
-            data["powertarget_watt"] = float(str(raw_watt).replace("W", "")) / 3
-        except (ValueError, TypeError):
-            data["powertarget_watt"] = None
-        data["status_temperature"] = await self._async_get_value(
-            "heater/status/temperature"
+        """Get all data from the API.
+
+        Returns the previous result object itself if nothing changed since the
+        last call.
+        """
+        changed_responses = self.transport.changed_responses
+        # While the heater is unreachable, fail fast or probe with one cheap
+        # request instead of letting every endpoint run into its timeout.
+        await self.transport.async_probe("status")
+        # The endpoints are independent of each other, so fetch them concurrently;
+        # the transport bounds how many requests are in flight against the host.
+        (
+            status,
+            fanspeed,
+            powertarget,
+            raw_watt,
+            temperature,
+            network_status,
+            pool_config,
+            status_summary,
+        ) = await _gather(
+            self.async_get_status(),
+            self._async_get_value("heater/status/fan"),
+            self._async_get_value("heater/powerTarget"),
+            self._async_get_value("heater/powerTarget/watt"),
+            self._async_get_value("heater/status/temperature"),
+            self.async_get_networkStatus(),
+            self.async_get_poolConfig(),
+            self._async_get_value("heater/status/summary"),
         )
-        data["network_status"] = await self.async_get_networkStatus()
-        data["pool_config"] = await self.async_get_poolConfig()
 
-        status_summary = await self._async_get_value("heater/status/summary")
+        data = {}
+        data["status"] = status
+        data["fanspeed"] = int(float(fanspeed))
+        data["powertarget"] = powertarget
+        data["powertarget_watt"] = self._parse_watt(raw_watt)
+        data["status_temperature"] = temperature
+        data["network_status"] = network_status
+        data["pool_config"] = pool_config
+
+        # Identical summary bodies come back as the very same object, in which
+        # case the fields parsed from it last time are still valid.
+        if status_summary is not self._last_summary:
+            self._last_summary = status_summary
+            self._last_summary_data = self._parse_status_summary(status_summary)
+        data.update(self._last_summary_data)
+        data["status_running"] = status is True and self._last_summary_data["status_running"]
 
-        # v0.4.x and up
-        if "forge" in status_summary:
-            # keep existing status check but guard for missing keys
-            data["status_running"] = (
-                    data.get("status") is True and status_summary.get("miningDevices", {}).get("enabled") == 1
-            )
+        data["enable"] = data["status_running"]
+        data["heater"] = self._data
 
-            mining = status_summary.get("miningDevices", {})
-            last_summaries = mining.get("lastSummaries") or []
-            last = last_summaries[0] if len(last_summaries) > 0 else {}
+        # The control lane may have fetched changed bodies meanwhile, so an
+        # unchanged counter alone does not mean the result is the same.
+        if self.transport.changed_responses == changed_responses and data == self._last_data:
+            return self._last_data
+        self._last_data = data
+        return data
 
-            # --- Mining device top-level values ---
-            # power target / consumption at device level
-            if "powerTargetW" in mining:
-                data["power_limit"] = mining.get("powerTargetW") / 3
-            if "powerConsumptionW" in mining:
-                data["power_consumption"] = mining.get("powerConsumptionW")
+    async def async_get_control_data(self) -> dict:
+        """Get the status and power target only.
+
+        Whether the miners run comes with the summary, so status_running and
+        enable combine the status with the summary of the last async_get_data.
+        Returns the previous result object itself if nothing changed.
+        """
+        changed_responses = self.transport.changed_responses
+        await self.transport.async_probe("status")
+        status, powertarget, raw_watt = await _gather(
+            self.async_get_status(),
+            self._async_get_value("heater/powerTarget"),
+            self._async_get_value("heater/powerTarget/watt"),
+        )
+        data = {
+            "status": status,
+            "powertarget": powertarget,
+            "powertarget_watt": self._parse_watt(raw_watt),
+        }
+        data["status_running"] = status is True and self._last_summary_data.get(
+            "status_running", False
+        )
+        data["enable"] = data["status_running"]
 
-            # overall hash rate (device-level reported as gigahash/s) -> convert to MH/s
-            if "hashRate" in mining and mining["hashRate"] is not None:
-                try:
-                    data["hashrate_overall_mhs"] = float(mining["hashRate"]) * 1000.0
-                except Exception:
-                    data["hashrate_overall_mhs"] = mining.get("hashRate")
-
-            # chip temps (top-level)
-            if "maxChipTemperature" in mining:
-                data["max_chip_temp"] = mining.get("maxChipTemperature")
-            if "minChipTemperature" in mining:
-                data["min_chip_temp"] = mining.get("minChipTemperature")
-
-            # device id (from last summary if present)
-            if "id" in last:
-                data["device_id"] = last.get("id")
-
-            # --- Parse last summary blocks if present ---
-            # Pool stats
-            pool = last.get("pool_stats") or {}
-            if pool:
-                data["accepted_shares"] = pool.get("accepted_shares")
-                data["rejected_shares"] = pool.get("rejected_shares")
-                data["stale_shares"] = pool.get("stale_shares")
-                data["last_difficulty"] = pool.get("last_difficulty")
-                data["best_share"] = pool.get("best_share")
-                data["generated_work"] = pool.get("generated_work")
-                # last_share_time -> convert to ms epoch if present
-                lst = pool.get("last_share_time")
-                if isinstance(lst, dict) and "seconds" in lst:
-                    try:
-                        data["last_share_time_ms"] = int(lst.get("seconds", 0)) * 1000 + int(
-                            lst.get("nanos", 0)) // 1_000_000
-                    except Exception:
-                        data["last_share_time"] = lst
-
-            # Miner stats
-            miner = last.get("miner_stats") or {}
-            if miner:
-                # found blocks
-                if "found_blocks" in miner:
-                    data["found_blocks"] = miner.get("found_blocks")
-
-                # real_hashrate provides multiple windows in GH/s -> convert to MH/s
-                real = miner.get("real_hashrate") or {}
-
-                def _gh_to_mh(d, path_keys):
-                    # safe accessor: returns value in GH/s converted to MH/s
-                    cur = d
-                    try:
-                        for k in path_keys:
-                            cur = cur[k]
-                        return float(cur) * 1000.0
-                    except Exception:
-                        return None
-
-                # Map windows (examples from response: last_5s, last_1m, last_5m, last_15m, last_24h, since_restart)
-                v = _gh_to_mh(real, ["last_5s", "gigahash_per_second"])
-                if v is not None:
-                    data["hashrate_5s"] = v
-                v = _gh_to_mh(real, ["last_1m", "gigahash_per_second"])
-                if v is not None:
-                    data["hashrate_1m"] = v
-                v = _gh_to_mh(real, ["last_5m", "gigahash_per_second"])
-                if v is not None:
-                    data["hashrate_5m"] = v
-                v = _gh_to_mh(real, ["last_15m", "gigahash_per_second"])
-                if v is not None:
-                    data["hashrate_15m"] = v
-                v = _gh_to_mh(real, ["last_24h", "gigahash_per_second"])
-                if v is not None:
-                    data["hashrate_24h"] = v
-                # a reasonable "average" fallback: since_restart
-                v = _gh_to_mh(real, ["since_restart", "gigahash_per_second"])
-                if v is not None:
-                    data["hashrate_av"] = v
-
-            # Power stats (from the summary block)
-            power = last.get("power_stats") or {}
-            approxs = power.get("approximated_consumption") or {}
-            if "watt" in approxs:
-                data["power_consumption"] = approxs.get("watt")
-            eff = power.get("efficiency") or {}
-            if "joule_per_terahash" in eff:
-                data["efficiency_j_per_th"] = eff.get("joule_per_terahash")
-
-            # Fans / temps
-            fans = last.get("fans")
-            if isinstance(fans, list):
-                # list of rpms and target ratios
-                data["fan_rpms"] = [f.get("rpm") for f in fans]
-                data["fan_target_speed_ratios"] = [f.get("target_speed_ratio") for f in fans]
-
-            highest_temp = last.get("highest_temperature") or {}
-            if "temperature" in highest_temp and isinstance(highest_temp["temperature"], dict):
-                data["highest_chip_temp_c"] = highest_temp["temperature"].get("degree_c")
-
-        # end if "forge" in status_summary
-        else:
-            for key in status_summary:
-                if key in ["foundBlocks", "poolStatus"]:
-                    data[key.lower()] = status_summary[key]
-                elif key == "power":
-                    power = status_summary[key] or {}
-                    if "limitW" in power:
-                        data["power_limit"] = power["limitW"] / 3
-                    if "approxConsumptionW" in power:
-                        data["power_consumption"] = power["approxConsumptionW"]
-                elif key == "realHashrate":
-                    hr = status_summary[key] or {}
-                    if "mhs5S" in hr:
-                        data["hashrate_5s"] = hr["mhs5S"]
-                    if "mhs1M" in hr:
-                        data["hashrate_1m"] = hr["mhs1M"]
-                    if "mhs5M" in hr:
-                        data["hashrate_5m"] = hr["mhs5M"]
-                    if "mhs15M" in hr:
-                        data["hashrate_15m"] = hr["mhs15M"]
-                    if "mhs24H" in hr:
-                        data["hashrate_24h"] = hr["mhs24H"]
-                    if "mhsAv" in hr:
-                        data["hashrate_av"] = hr["mhsAv"]
-
-            data["status_running"] = (
-                    data["status"] is True and "tunerStatus" in status_summary
-            )
+        if self.transport.changed_responses == changed_responses and data == self._last_control:
+            return self._last_control
+        self._last_control = data
+        return data
 
-        data["enable"] = data["status_running"]
-        data["heater"] = self._data
+    @staticmethod
+    def _parse_watt(raw_watt: Any) -> float | None:
+        try:
+            return float(str(raw_watt).replace("W", "")) / 3
+        except (ValueError, TypeError):
+            return None
 
+    def _parse_status_summary(self, status_summary: dict) -> dict:
+        """Extract the fields of a heater/status/summary response.
+
+        status_running only reflects the summary here, the caller combines it
+        with the operational status.
+        """
+        # v0.4.x and up
+        if "forge" in status_summary:
+            data = FORGE_SUMMARY.parse(status_summary)
+            data["status_running"] = (status_summary.get("miningDevices") or {}).get("enabled") == 1
+        else:
+            data = LEGACY_SUMMARY.parse(status_summary)
+            data["status_running"] = "tunerStatus" in status_summary
         return data
 
     async def async_set_powerTarget(self, value: int) -> None:
-        """Set the Power target. Values must between 0 and 4."""
+        """Set the Power target. Values must between 0 and 4.
+
+        Rapid successive calls are coalesced; only the latest value is sent.
+        """
         if value > 4 or value < 0:
             msg = f"Value must be between 0 and 4, but was {value}"
             raise HeaterControlApiClientError(msg)
 
-        await self._api_wrapper(
-            method="post",
-            url=f"http://{self._host}/21control/heater/powerTarget/{value}",
+        await self.commands.async_submit("powerTarget", value, self._async_send_powerTarget)
+
+    async def _async_send_powerTarget(self, value: int) -> None:
+        await self._async_post_value(
+            f"heater/powerTarget/{value}",
             headers={"Content-type": "application/json; charset=UTF-8"},
         )
 
     async def async_set_enable(self, value: bool) -> None:
         """Enable or disable the Heater."""
-        await self._api_wrapper(
-            method="post",
-            url=f"http://{self._host}/21control/heater/enable",
+        await self._async_post_value(
+            "heater/enable",
             data={"enabled": value},
             headers={"Content-type": "application/json; charset=UTF-8"},
         )
 
     async def async_get_status(self) -> bool:
         """Get data from the API."""
-        ret = await self._api_wrapper(
-            method="get",
-            url=f"http://{self._host}/21control/status",
-        )
+        ret = await self._async_get_value("status")
         LOGGER.debug("typeof ret: %s", type(ret))
         if "operational" in ret:
             return ret["operational"]
@@ -289,10 +249,7 @@ class HeaterControlApiClient(DeviceApiClientBase):
 
     async def async_get_device(self) -> Any:
         """Get heater data from the API."""
-        ret = await self._api_wrapper(
-            method="get",
-            url=f"http://{self._host}/21control/status/system",
-        )
+        ret = await self._async_get_value("status/system")
 
         product_id_raw = ret.get("productId") or ""
         product_id_parts = product_id_raw.split()
@@ -307,10 +264,7 @@ class HeaterControlApiClient(DeviceApiClientBase):
 
     async def async_get_poolConfig(self) -> Any:
         """Get heater pool config from the API."""
-        ret = await self._api_wrapper(
-            method="get",
-            url=f"http://{self._host}/21control/heater/poolConfig",
-        )
+        ret = await self._async_get_value("heater/poolConfig")
         LOGGER.debug("received poolConfig: %s", ret)
         data = {
             "poolUrl1": pick("url1", "poolUrl1", ret),
@@ -322,10 +276,7 @@ class HeaterControlApiClient(DeviceApiClientBase):
 
     async def async_get_networkStatus(self) -> Any:
         """Get network status from the API."""
-        ret = await self._api_wrapper(
-            method="get",
-            url=f"http://{self._host}/21control/heater/networkStatus",
-        )
+        ret = await self._async_get_value("heater/networkStatus")
         data = {
             "type": re.sub(r"\d", "", ret.get("interface") or ""),
             "ssid": ret.get("essid"),
@@ -337,62 +288,16 @@ class HeaterControlApiClient(DeviceApiClientBase):
 
     async def _async_get_value(self, arg: str) -> Any:
         """Get data from the API."""
-        return await self._api_wrapper(
-            method="get",
-            url=f"http://{self._host}/21control/{arg}",
-        )
+        return await self.transport.async_get(arg)
 
-    async def _api_wrapper(
+    async def _async_post_value(
         self,
-        method: str,
-        url: str,
+        arg: str,
         data: dict | None = None,
         headers: dict | None = None,
     ) -> Any:
-        """Get information from the API."""
-        request_headers = {"Host": self._host}
-        if headers:
-            request_headers.update(headers)
-        try:
-            async with asyncio.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=request_headers,
-                    json=data,
-                )
-                _verify_response_or_raise(response)
-                responseType = "text"
-                if "Content-Type" in response.headers:
-                    if "application/json" in response.headers["Content-Type"]:
-                        responseType = "json"
-                if responseType == "json":
-                    try:
-                        ret = await response.json()
-                    except (ValueError, aiohttp.ContentTypeError):
-                        ret = await response.text()
-                else:
-                    ret = await response.text()
-                LOGGER.debug("_api_wrapper => url:%s => response:%s", url, ret)
-                return ret
-
-        except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
-            raise HeaterControlApiClientCommunicationError(
-                msg,
-            ) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
-            msg = f"Error fetching information - {exception}"
-            raise HeaterControlApiClientCommunicationError(
-                msg,
-            ) from exception
-        except HeaterControlApiClientError as e:
-            raise e
-        except Exception as exception:  # pylint: disable=broad-except
-            msg = f"Something really wrong happened! - {exception}"
-            raise HeaterControlApiClientError(
-                msg,
-            ) from exception
+        """Write data to the API."""
+        return await self.transport.async_post(arg, data=data, headers=headers)
 
 
 class PortControlApiClient(DeviceApiClientBase):
@@ -401,19 +306,26 @@ class PortControlApiClient(DeviceApiClientBase):
     def __init__(
             self,
             host: str,
-            session: aiohttp.ClientSession,
+            session: aiohttp.ClientSession | None = None,
+            cache_ttls: dict[str, float] | None = None,
+            limiter: contextlib.AbstractAsyncContextManager[Any] | None = None,
     ) -> None:
         self._host = host
-        self._session = session
+        self.transport = DeviceTransport(host, "21port", session, cache_ttls, limiter=limiter)
+        self.commands = CommandCoalescer()
+        self._last_summary: Any = None
+        self._last_summary_data: dict = {}
+        self._last_data: dict | None = None
+        self._last_control: dict | None = None
 
     async def async_get_status(self) -> bool:
-        ret = await self._api_wrapper("get", f"http://{self._host}/21port/status/summary")
+        ret = await self._async_get_value("status/summary")
         # The summary endpoint returns PortSummaryDto — a valid dict response means the device is up
         return isinstance(ret, dict) and "deviceCount" in ret
 
     async def async_get_device(self) -> dict:
-        summary = await self._api_wrapper("get", f"http://{self._host}/21port/status/summary")
-        config = await self._api_wrapper("get", f"http://{self._host}/21port/status/configuration")
+        summary = await self._async_get_value("status/summary")
+        config = await self._async_get_value("status/configuration")
         firmware = summary.get("firmwareVersion") or {}
         return {
             "model": "21PORT",
@@ -423,10 +335,56 @@ class PortControlApiClient(DeviceApiClientBase):
         }
 
     async def async_get_data(self) -> dict:
-        data = {}
+        changed_responses = self.transport.changed_responses
+        await self.transport.async_probe("status/configuration")
         # /status/summary returns the full PortSummaryDto — one call covers everything
-        summary = await self._api_wrapper("get", f"http://{self._host}/21port/status/summary")
+        summary = await self._async_get_value("status/summary")
+        # An unchanged body is handed out as the same object; reuse its parse result
+        if summary is not self._last_summary:
+            self._last_summary = summary
+            self._last_summary_data = self._parse_summary(summary)
+        data = dict(self._last_summary_data)
 
+        try:
+            pool_list = await self._async_get_value("mining/poolConfig")
+            data["pool_config"] = pool_list if isinstance(pool_list, list) else []
+        except Exception:
+            data["pool_config"] = []
+
+        if self.transport.changed_responses == changed_responses and data == self._last_data:
+            return self._last_data
+        self._last_data = data
+        return data
+
+    async def async_get_control_data(self) -> dict:
+        """Get the forge status, power level and whether mining is enabled only.
+
+        The 21PORT has no cheaper endpoint for them than the summary, so this
+        fetches the summary but skips the pool config and the full parse.
+        Returns the previous result object itself if nothing changed.
+        """
+        changed_responses = self.transport.changed_responses
+        await self.transport.async_probe("status/configuration")
+        summary = await self._async_get_value("status/summary")
+        forge_status = summary.get("forgeStatus", "")
+        mining_enabled = any(d.get("enabled") for d in summary.get("devices") or ())
+        data = {
+            "forge_status": forge_status,
+            "forge_reachable": forge_status in ("running", "running_no_main_loop", "paused"),
+            "status_running": forge_status in ("running", "running_no_main_loop"),
+            "power_level": summary.get("powerLevel"),
+            "mining_enabled": mining_enabled,
+            "enable": mining_enabled,
+        }
+
+        if self.transport.changed_responses == changed_responses and data == self._last_control:
+            return self._last_control
+        self._last_control = data
+        return data
+
+    def _parse_summary(self, summary: dict) -> dict:
+        """Extract the fields of a /21port/status/summary response."""
+        data = {}
         firmware = summary.get("firmwareVersion") or {}
         data["version"] = firmware.get("controlVersion", "")
         data["device_count"] = int(summary.get("deviceCount", 0))
@@ -448,90 +406,85 @@ class PortControlApiClient(DeviceApiClientBase):
         data["enable"] = data["mining_enabled"]
         data["devices"] = devices
 
-        try:
-            pool_list = await self._api_wrapper("get", f"http://{self._host}/21port/mining/poolConfig")
-            data["pool_config"] = pool_list if isinstance(pool_list, list) else []
-        except Exception:
-            data["pool_config"] = []
-
         data["status_running"] = data["forge_status"] in ("running", "running_no_main_loop")
         return data
 
     async def async_set_enable(self, value: bool) -> None:
-        await self._api_wrapper(
-            "post",
-            f"http://{self._host}/21port/mining/enable",
+        await self._async_post_value(
+            "mining/enable",
             data={"enabled": value},
         )
 
     async def async_set_device_enable(self, device_id: str, value: bool) -> None:
-        await self._api_wrapper(
-            "post",
-            f"http://{self._host}/21port/mining/enable",
+        await self._async_post_value(
+            "mining/enable",
             data={"enabled": value, "minerId": device_id},
         )
 
     async def async_set_device_power_level(self, device_id: str, value: int) -> None:
         if not 0 <= value <= 4:
             raise HeaterControlApiClientError(f"Power level must be 0-4, got {value}")
-        await self._api_wrapper(
-            "post",
-            f"http://{self._host}/21port/mining/powerLevel",
-            data={"level": value, "minerId": device_id},
-        )
+
+        async def send(level: int) -> None:
+            await self._async_post_value(
+                "mining/powerLevel",
+                data={"level": level, "minerId": device_id},
+            )
+
+        # rapid successive levels for the same miner collapse into the latest one
+        await self.commands.async_submit(("powerLevel", device_id), value, send)
+
+    async def async_set_devices(
+        self,
+        device_ids: Iterable[str],
+        enabled: bool | None = None,
+        power_level: int | None = None,
+    ) -> dict[str, str | None]:
+        """Enable/disable and/or set the power level of many mining devices at once.
+
+        The writes run concurrently, at most BULK_COMMAND_CONCURRENCY miners at a
+        time. Returns the error per miner id, None for the miners that succeeded.
+        """
+        if power_level is not None and not 0 <= power_level <= 4:
+            raise HeaterControlApiClientError(f"Power level must be 0-4, got {power_level}")
+        semaphore = asyncio.Semaphore(BULK_COMMAND_CONCURRENCY)
+
+        async def apply(device_id: str) -> tuple[str, str | None]:
+            async with semaphore:
+                try:
+                    if enabled is not None:
+                        await self._async_post_value(
+                            "mining/enable",
+                            data={"enabled": enabled, "minerId": device_id},
+                        )
+                    if power_level is not None:
+                        await self._async_post_value(
+                            "mining/powerLevel",
+                            data={"level": power_level, "minerId": device_id},
+                        )
+                except HeaterControlApiClientError as exception:
+                    LOGGER.debug("Bulk command failed for mining device %s: %s", device_id, exception)
+                    return device_id, str(exception) or type(exception).__name__
+            return device_id, None
+
+        return dict(await asyncio.gather(*(apply(device_id) for device_id in device_ids)))
 
     async def async_set_powerLevel(self, value: int) -> None:
         if not 0 <= value <= 4:
             raise HeaterControlApiClientError(f"Power level must be 0-4, got {value}")
-        await self._api_wrapper(
-            "post",
-            f"http://{self._host}/21port/mining/powerLevel",
-            data={"level": value},
-        )
 
-    async def _api_wrapper(
-            self,
-            method: str,
-            url: str,
-            data: dict | None = None,
-            headers: dict | None = None,
-    ) -> Any:
-        """Get information from the API."""
-        request_headers = {"Host": self._host}
-        if headers:
-            request_headers.update(headers)
-        try:
-            async with asyncio.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=request_headers,
-                    json=data,
-                )
-                LOGGER.debug("21port _api_wrapper => %s %s => status:%s", method.upper(), url, response.status)
-                _verify_response_or_raise(response)
-                responseType = "text"
-                if "Content-Type" in response.headers:
-                    if "application/json" in response.headers["Content-Type"]:
-                        responseType = "json"
-                if responseType == "json":
-                    try:
-                        ret = await response.json()
-                    except (ValueError, aiohttp.ContentTypeError):
-                        ret = await response.text()
-                else:
-                    ret = await response.text()
-                LOGGER.debug("21port _api_wrapper => url:%s => response:%s", url, ret)
-                return ret
-
-        except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
-            raise HeaterControlApiClientCommunicationError(msg) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
-            msg = f"Error fetching information - {exception}"
-            raise HeaterControlApiClientCommunicationError(msg) from exception
-        except HeaterControlApiClientError as e:
-            raise e
-        except Exception as exception:  # pylint: disable=broad-except
-            msg = f"Something really wrong happened! - {exception}"
-            raise HeaterControlApiClientError(msg) from exception
+        async def send(level: int) -> None:
+            await self._async_post_value(
+                "mining/powerLevel",
+                data={"level": level},
+            )
+
+        await self.commands.async_submit(("powerLevel", None), value, send)
+
+    async def _async_get_value(self, path: str) -> Any:
+        """GET a 21port endpoint."""
+        return await self.transport.async_get(path)
+
+    async def _async_post_value(self, path: str, data: dict | None = None) -> Any:
+        """POST to a 21port endpoint."""
+        return await self.transport.async_post(path, data=data)
@@ -0,0 +1,106 @@
+"""Coalescing of write commands sent to a device."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from .const import LOGGER
+
+# A write is sent once no newer value for the same setting arrived for this
+# long, but no later than COMMAND_MAX_DELAY after the first value of a burst.
+COMMAND_SETTLE_TIME = 0.4  # seconds
+COMMAND_MAX_DELAY = 2.0  # seconds
+
+
+@dataclass
+class _PendingCommand:
+    future: asyncio.Future
+    deadline: float
+    value: Any = None
+    send: Callable[[Any], Awaitable[Any]] | None = None
+    handle: asyncio.TimerHandle | None = None
+    callers: int = 0
+
+
+class CommandCoalescer:
+    """Collapse rapid successive writes of the same setting into one.
+
+    Every write of a setting within the settle window replaces the pending
+    value; only the latest one is sent, and all callers of the burst are
+    released together with its outcome. Sends are serialized per device.
+    """
+
+    def __init__(
+        self,
+        settle_time: float = COMMAND_SETTLE_TIME,
+        max_delay: float = COMMAND_MAX_DELAY,
+    ) -> None:
+        self._settle_time = settle_time
+        self._max_delay = max_delay
+        self._pending: dict[Hashable, _PendingCommand] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    async def async_submit(
+        self,
+        key: Hashable,
+        value: Any,
+        send: Callable[[Any], Awaitable[Any]],
+    ) -> None:
+        """Queue value for the setting key and wait until it has been sent.
+
+        Raises the error of the send if it failed.
+        """
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        pending = self._pending.get(key)
+        if pending is None:
+            future = loop.create_future()
+            # retrieve the outcome even if every caller was cancelled meanwhile
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            pending = self._pending[key] = _PendingCommand(
+                future=future, deadline=now + self._max_delay
+            )
+        else:
+            pending.handle.cancel()
+            LOGGER.debug("Coalescing write of %s: %s replaces %s", key, value, pending.value)
+        pending.value = value
+        pending.send = send
+        pending.callers += 1
+        delay = max(0.0, min(self._settle_time, pending.deadline - now))
+        pending.handle = loop.call_later(delay, self._flush, key)
+        await asyncio.shield(pending.future)
+
+    def _flush(self, key: Hashable) -> None:
+        pending = self._pending.pop(key)
+        task = asyncio.get_running_loop().create_task(self._async_send(key, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_send(self, key: Hashable, pending: _PendingCommand) -> None:
+        try:
+            async with self._lock:
+                LOGGER.debug(
+                    "Sending %s=%s for %s coalesced write(s)", key, pending.value, pending.callers
+                )
+                await pending.send(pending.value)
+        except asyncio.CancelledError:
+            pending.future.cancel()
+            raise
+        except Exception as exception:  # pylint: disable=broad-except
+            pending.future.set_exception(exception)
+        else:
+            pending.future.set_result(None)
+
+    def cancel(self) -> None:
+        """Drop all queued writes and release their callers."""
+        for pending in self._pending.values():
+            pending.handle.cancel()
+            pending.future.cancel()
+        self._pending.clear()
+        for task in self._tasks:
+            task.cancel()
@@ -9,6 +9,7 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries, exceptions
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     SelectSelector,
@@ -18,7 +19,19 @@ from homeassistant.helpers.selector import (
 
 from .api import HeaterControlApiClientAuthenticationError, HeaterControlApiClientCommunicationError, \
     HeaterControlApiClientOutdatedError, PortControlApiClient
-from .const import CONF_DEVICE_TYPE, CONF_POLLING_INTERVAL, DEVICE_TYPE_OFEN, DEVICE_TYPE_PORT, DOMAIN, LOGGER
+from .const import (
+    CONF_DEVICE_TYPE,
+    CONF_MAX_POLLING_INTERVAL,
+    CONF_MIN_POLLING_INTERVAL,
+    CONF_POLLING_INTERVAL,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEVICE_TYPE_OFEN,
+    DEVICE_TYPE_PORT,
+    DOMAIN,
+    LOGGER,
+    MAX_POLLING_INTERVAL_LIMIT,
+)
 from .device_registry import DEVICE_REGISTRY, create_client
 
 
@@ -61,6 +74,14 @@ class HeaterControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+            config_entry: config_entries.ConfigEntry,
+    ) -> HeaterControlOptionsFlow:
+        """Return the options flow."""
+        return HeaterControlOptionsFlow()
+
     def __init__(self) -> None:
         """Initialize flow."""
         self._host: str | None = None
@@ -179,3 +200,31 @@ class HeaterControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             device[CONF_DEVICE_TYPE] = DEVICE_TYPE_OFEN
             device["pool_config"] = pool_config
             return device
+
+
+class HeaterControlOptionsFlow(config_entries.OptionsFlow):
+    """Handle the options of a 21energy_heater_control entry."""
+
+    async def async_step_init(
+            self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Set the bounds of the adaptive polling interval."""
+        errors = {}
+        if user_input is not None:
+            if user_input[CONF_MIN_POLLING_INTERVAL] > user_input[CONF_MAX_POLLING_INTERVAL]:
+                errors["base"] = "min_above_max"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema({
+            vol.Required(
+                CONF_MIN_POLLING_INTERVAL,
+                default=options.get(CONF_MIN_POLLING_INTERVAL, DEFAULT_MIN_POLLING_INTERVAL),
+            ): vol.All(int, vol.Range(min=1, max=MAX_POLLING_INTERVAL_LIMIT)),
+            vol.Required(
+                CONF_MAX_POLLING_INTERVAL,
+                default=options.get(CONF_MAX_POLLING_INTERVAL, DEFAULT_MAX_POLLING_INTERVAL),
+            ): vol.All(int, vol.Range(min=1, max=MAX_POLLING_INTERVAL_LIMIT)),
+        })
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
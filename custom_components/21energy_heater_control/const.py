@@ -9,6 +9,22 @@ TITLE = "21energy Heater Control"
 MANUFACTURER = "21energy"
 
 CONF_POLLING_INTERVAL = "polling_interval"
+# bounds of the adaptive polling interval (options)
+CONF_MIN_POLLING_INTERVAL = "min_polling_interval"
+CONF_MAX_POLLING_INTERVAL = "max_polling_interval"
+DEFAULT_MIN_POLLING_INTERVAL = 5  # seconds
+DEFAULT_MAX_POLLING_INTERVAL = 120  # seconds
+# Upper bound of the maximum. The scheduler may stretch an interval by half to
+# meet the phase of the entry, and gaps between polls longer than
+# ENERGY_MAX_GAP (300 s) are not integrated into the energy counters.
+MAX_POLLING_INTERVAL_LIMIT = 180  # seconds
+# The control state (status, enable, power target) is polled at the adaptive
+# interval, the full summary with pool and miner stats at most this often
+FULL_POLL_INTERVAL = 60  # seconds
+# Upper bound for fetching all data of one poll cycle
+POLL_TIME_BUDGET = 20  # seconds
+# Delay of the refresh confirming optimistically applied writes
+REFRESH_AFTER_WRITE_DELAY = 2  # seconds
 DEVICE_CLASS_ENUM = "enum"
 STATE_ON = "on"
 STATE_OFF = "off"
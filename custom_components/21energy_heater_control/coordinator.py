@@ -2,24 +2,83 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_HOST
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_at
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
     HeaterControlApiClientAuthenticationError,
     HeaterControlApiClientError,
 )
-from .const import CONF_DEVICE_TYPE, DEVICE_TYPE_PORT, DOMAIN, MANUFACTURER
+from .const import (
+    CONF_DEVICE_TYPE,
+    CONF_MAX_POLLING_INTERVAL,
+    CONF_MIN_POLLING_INTERVAL,
+    DEFAULT_MAX_POLLING_INTERVAL,
+    DEFAULT_MIN_POLLING_INTERVAL,
+    DEVICE_TYPE_PORT,
+    DOMAIN,
+    FULL_POLL_INTERVAL,
+    MANUFACTURER,
+    MAX_POLLING_INTERVAL_LIMIT,
+    POLL_TIME_BUDGET,
+    REFRESH_AFTER_WRITE_DELAY,
+)
+from .energy import EnergyAccumulator
+from .lifecycle import DeviceLifecycle
+from .polling import PollingPolicy
+from .scheduler import async_get_scheduler
+from .snapshot import SnapshotStore
+from .telemetry import TelemetryStore, heater_sample, port_sample
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from .data import HeaterControlConfigEntry
 
 
+def _lookup(data: dict | None, key: str, device_id: str | None) -> Any:
+    """Return data[key], or key of the 21PORT mining device device_id."""
+    data = data or {}
+    if device_id is None:
+        return data.get(key)
+    device = next((d for d in data.get("devices") or [] if d["id"] == device_id), None)
+    return device.get(key) if device is not None else None
+
+
+def _with_value(data: dict, key: str, value: Any, device_id: str | None) -> dict:
+    """Return a copy of data with key (of the 21PORT mining device device_id) set to value."""
+    if device_id is None:
+        return {**data, key: value}
+    return {
+        **data,
+        "devices": [
+            {**d, key: value} if d["id"] == device_id else d
+            for d in data.get("devices") or []
+        ],
+    }
+
+
+@dataclass
+class _PendingWrite:
+    """Optimistic value of a setting with writes in progress."""
+
+    value: Any
+    # the value the last completed write sent, or the one from before the writes
+    confirmed: Any
+    writes: int = 0
+    sent: bool = False
+
+
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class HeaterControlDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -37,8 +96,72 @@ class HeaterControlDataUpdateCoordinator(DataUpdateCoordinator):
         logger.debug("DATA UPDATE COORDINATOR INIT with data %s", entry.data)
         self.entry = entry
         self.device = entry.data.get("product_id") or entry.data[CONF_HOST]
+        # The clients return the previous data object when no response changed,
+        # so listeners are only notified when there is something new to show.
         super().__init__(
-            hass, logger=logger, name=name, update_interval=update_interval
+            hass,
+            logger=logger,
+            name=name,
+            # the polls are scheduled by _set_polling_interval, at the phase
+            # the scheduler gave this entry
+            update_interval=None,
+            always_update=False,
+            # Writes apply their value optimistically and request a refresh to
+            # confirm it; several writes in a row share one confirmation.
+            request_refresh_debouncer=Debouncer(
+                hass,
+                logger,
+                cooldown=REFRESH_AFTER_WRITE_DELAY,
+                immediate=False,
+            ),
+        )
+        # (key, device id) -> optimistic value of writes not completed yet
+        self._pending_writes: dict[tuple[str, str | None], _PendingWrite] = {}
+        # (key, device id) -> (value, time) of completed writes, confirmed by
+        # the first refresh started after that time
+        self._expected: dict[tuple[str, str | None], tuple[Any, float]] = {}
+        self._indexed_devices: list[dict] | None = None
+        self._device_index: dict[str, dict] = {}
+        # (device id, field) pairs changed by the update listeners are notified
+        # of; None notifies every listener
+        self._changed_contexts: set[tuple[str, str]] | None = None
+        self._notified_success: bool | None = None
+        # bumped on every notification round; entities write their state at
+        # most once per generation
+        self.generation = 0
+        self._generation_cache: dict[str, tuple[int, Any]] = {}
+        # 21PORT mining devices appearing and disappearing between refreshes
+        self.device_lifecycle = DeviceLifecycle()
+        # update_interval is the configured interval; the policy adapts it
+        # within the bounds of the options after every poll
+        self.polling = PollingPolicy(
+            update_interval.total_seconds(),
+            entry.options.get(CONF_MIN_POLLING_INTERVAL, DEFAULT_MIN_POLLING_INTERVAL),
+            min(
+                entry.options.get(CONF_MAX_POLLING_INTERVAL, DEFAULT_MAX_POLLING_INTERVAL),
+                MAX_POLLING_INTERVAL_LIMIT,
+            ),
+        )
+        # two polling lanes: the full data at most every FULL_POLL_INTERVAL,
+        # the control state in between, merged over the last full data
+        self._full_data: dict | None = None
+        self._full_polled_at = 0.0
+        self._full_due = True
+        self._control_data: dict | None = None
+        self._merged_data: dict | None = None
+        # the interval chosen by the policy; next_poll_delay is the delay to
+        # the next poll at the phase the scheduler gave this entry
+        self.polling_interval = self.polling.interval
+        self.next_poll_delay: float | None = None
+        self.scheduler = async_get_scheduler(hass)
+        self._cancel_poll: Callable[[], None] | None = None
+        entry.async_on_unload(self._async_cancel_poll)
+        self._polled_source: dict | None = None
+        self._polled_data: dict = {}
+        self.energy = EnergyAccumulator(hass, entry.entry_id)
+        self.snapshot = SnapshotStore(hass, entry.entry_id)
+        self.telemetry = TelemetryStore(
+            port_sample if entry.data.get(CONF_DEVICE_TYPE) == DEVICE_TYPE_PORT else heater_sample
         )
 
     @property
@@ -49,6 +172,65 @@ class HeaterControlDataUpdateCoordinator(DataUpdateCoordinator):
                 return self.last_update_success
         return False
 
+    @property
+    def stale(self) -> bool:
+        """Return whether the data is the persisted snapshot, not yet confirmed by the device."""
+        return bool((self.data or {}).get("stale"))
+
+    @callback
+    def async_restore(self, data: dict) -> None:
+        """Start from a persisted snapshot, marked stale until the first live refresh."""
+        self.data = {**data, "stale": True}
+        if (devices := data.get("devices")) is not None:
+            # the entities of the known miners are set up from the snapshot
+            self.device_lifecycle.process({}, devices)
+            self.device_lifecycle.async_dispatch()
+
+    def get_device(self, device_id: str) -> dict | None:
+        """Return the 21PORT mining device device_id from the current data.
+
+        The id index is rebuilt once for every new device list.
+        """
+        return self._get_device_index().get(device_id)
+
+    def _get_device_index(self) -> dict[str, dict]:
+        devices = (self.data or {}).get("devices")
+        if devices is not self._indexed_devices:
+            self._indexed_devices = devices
+            self._device_index = {d["id"]: d for d in devices or ()}
+        return self._device_index
+
+    def cached(self, key: str, compute: Callable[[dict], Any]) -> Any:
+        """Return compute(data), computed at most once per generation for key."""
+        hit = self._generation_cache.get(key)
+        if hit is not None and hit[0] == self.generation:
+            return hit[1]
+        value = compute(self.data or {})
+        self._generation_cache[key] = (self.generation, value)
+        return value
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, skipping per-device entities whose fields did not change.
+
+        Listeners registered with a (device id, field) context are only called
+        if that field changed; listeners without context are always called.
+        Everyone is notified when the update success flipped. Device lifecycle
+        events of the refresh are dispatched first, so entities of new devices
+        are added before the others update.
+        """
+        self.generation += 1
+        self.device_lifecycle.async_dispatch()
+        changed = self._changed_contexts
+        self._changed_contexts = None
+        if changed is None or self._notified_success is not self.last_update_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
     @property
     def device_info(self):
         if self.entry.data.get(CONF_DEVICE_TYPE) == DEVICE_TYPE_PORT:
@@ -68,16 +250,236 @@ class HeaterControlDataUpdateCoordinator(DataUpdateCoordinator):
             serial_number=self.entry.data["product_id"],
         )
 
-    async def async_set_device_enable(self, key: str, value: bool) -> Any:
-        if key == "enable":
-            await self.entry.runtime_data.client.async_set_enable(value)
-            self.data[key] = value
+    async def async_write(
+        self,
+        key: str,
+        value: Any,
+        write: Callable[[], Awaitable[Any]],
+        device_id: str | None = None,
+    ) -> None:
+        """Write a value to the device, showing it before the device confirms it.
 
-    async def _async_update_data(self) -> Any:
-        """Update data via library."""
+        The value is applied to the current data (of the 21PORT mining device
+        device_id, if given) and listeners are notified right away. Refreshes
+        keep showing it until the write is completed. If it fails, the last
+        value sent, or the one from before the burst of writes, is restored;
+        otherwise a debounced refresh replaces the optimistic value with what
+        the device reports.
+        """
+        target = (key, device_id)
+        pending = self._pending_writes.get(target)
+        if pending is None:
+            pending = self._pending_writes[target] = _PendingWrite(
+                value, self._get_value(key, device_id)
+            )
+        pending.value = value
+        pending.writes += 1
+        self._expected.pop(target, None)
+        self._set_value(key, value, device_id)
+        self.polling.note_write(time.monotonic())
+        try:
+            await write()
+        except HeaterControlApiClientError as exception:
+            self._end_write(target, pending, value, sent=False)
+            raise HomeAssistantError(f"Failed to set {key}: {exception}") from exception
+        except BaseException:
+            # cancelled; the value may have been sent, the refresh tells
+            self._end_write(target, pending, value, sent=True)
+            raise
+        self._end_write(target, pending, value, sent=True)
+        await self.async_request_refresh()
+
+    def _end_write(
+        self, target: tuple[str, str | None], pending: _PendingWrite, value: Any, sent: bool
+    ) -> None:
+        """Account for a completed write; the last one of a setting settles its value.
+
+        Writes complete in the order they were made, also those coalesced
+        into a single request.
+        """
+        if sent:
+            pending.confirmed = value
+            pending.sent = True
+        pending.writes -= 1
+        if pending.writes:
+            return
+        del self._pending_writes[target]
+        key, device_id = target
+        if pending.confirmed != pending.value:
+            # the latest value failed; show the last one sent, or the one from
+            # before the writes
+            self._set_value(key, pending.confirmed, device_id)
+        if pending.sent:
+            self._expected[target] = (pending.confirmed, time.monotonic())
+            # confirm the write with the full data, as the control lane does
+            # not cover the miners
+            self._full_due = True
+
+    def _get_value(self, key: str, device_id: str | None) -> Any:
+        if device_id is None:
+            return (self.data or {}).get(key)
+        device = self.get_device(device_id)
+        return device.get(key) if device is not None else None
+
+    def _set_value(self, key: str, value: Any, device_id: str | None) -> None:
+        # Replace rather than mutate: the client may hand the current object
+        # out again when the device reports nothing new.
+        self._changed_contexts = set() if device_id is None else {(device_id, key)}
+        self.data = _with_value(self.data or {}, key, value, device_id)
+        self.async_update_listeners()
+
+    def _apply_unconfirmed(self, data: dict, started: float) -> dict:
+        """Return data with the values of writes the refresh cannot reflect yet.
+
+        These are the writes still in progress and those completed after the
+        refresh started.
+        """
+        values = {target: pending.value for target, pending in self._pending_writes.items()}
+        for target, (value, written_at) in self._expected.items():
+            if written_at > started:
+                values.setdefault(target, value)
+        for (key, device_id), value in values.items():
+            if _lookup(data, key, device_id) != value:
+                data = _with_value(data, key, value, device_id)
+        return data
+
+    def _check_expected(self, data: dict, started: float) -> None:
+        """Log optimistic values the device did not take over.
+
+        Only writes completed before the refresh started are checked, and
+        then dropped.
+        """
+        for target, (value, written_at) in list(self._expected.items()):
+            if written_at > started:
+                continue
+            del self._expected[target]
+            key, device_id = target
+            actual = _lookup(data, key, device_id)
+            if actual != value:
+                self.logger.debug(
+                    "Device reports %s=%s%s after writing %s, rolling back",
+                    key, actual, f" for {device_id}" if device_id else "", value,
+                )
+
+    def _set_polling_interval(self, seconds: float) -> None:
+        if seconds != self.polling_interval:
+            self.logger.debug("Polling %s every %s s", self.device, seconds)
+            self.polling_interval = seconds
+        now = self.hass.loop.time()
+        self.next_poll_delay = self.scheduler.delay(self.entry.entry_id, seconds, now)
+        # Scheduled here rather than through update_interval, whose timer
+        # rounds to the second and adds a random offset, off the phase.
+        self._async_cancel_poll()
+        self._cancel_poll = async_call_at(self.hass, self._async_poll, now + self.next_poll_delay)
+
+    @callback
+    def _async_cancel_poll(self) -> None:
+        if self._cancel_poll is not None:
+            self._cancel_poll()
+            self._cancel_poll = None
+
+    @callback
+    def _async_poll(self, _now: Any) -> None:
+        self._cancel_poll = None
+        if self.hass.is_stopping:
+            return
+        self.entry.async_create_background_task(
+            self.hass, self._async_scheduled_refresh(), f"{DOMAIN} poll {self.entry.entry_id}"
+        )
+
+    async def _async_scheduled_refresh(self) -> None:
+        await self.async_refresh()
+        # Failures other than UpdateFailed leave the next poll unscheduled;
+        # keep polling unless the credentials were rejected.
+        if self._cancel_poll is None and not isinstance(
+            self.last_exception, ConfigEntryAuthFailed
+        ):
+            self._set_polling_interval(self.polling_interval)
+
+    def _with_polling_interval(self, data: dict) -> dict:
+        """Return data with the effective polling interval, for its diagnostic sensor."""
+        seconds = self.polling_interval
+        if data is not self._polled_source or seconds != self._polled_data["polling_interval"]:
+            self._polled_source = data
+            self._polled_data = {**data, "polling_interval": seconds}
+        return self._polled_data
+
+    async def _async_fetch_data(self) -> tuple[dict, bool]:
+        """Return the data of the lane that is due, and whether it was the full one."""
+        now = time.monotonic()
+        full = self._full_due or now - self._full_polled_at >= FULL_POLL_INTERVAL
+        # cleared up front, so a write completed during the fetch asks for
+        # another full poll
+        self._full_due = False
+        try:
+            data = await self._async_fetch_lane(full)
+        except BaseException:
+            self._full_due = self._full_due or full
+            raise
+        if full:
+            self._full_data = self._merged_data = data
+            self._full_polled_at = now
+            self._control_data = None
+            return data, True
+        return self._merge_control(data), False
+
+    async def _async_fetch_lane(self, full: bool) -> dict:
+        client = self.entry.runtime_data.client
         try:
-            return await self.entry.runtime_data.client.async_get_data()
+            async with asyncio.timeout(POLL_TIME_BUDGET):
+                if full:
+                    return await client.async_get_data()
+                return await client.async_get_control_data()
+        except TimeoutError as exception:
+            msg = f"Fetching data took longer than {POLL_TIME_BUDGET} s"
+            raise UpdateFailed(msg) from exception
         except HeaterControlApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except HeaterControlApiClientError as exception:
             raise UpdateFailed(exception) from exception
+
+    async def async_refresh_full(self) -> None:
+        """Refresh now with the full data, e.g. after writes to many miners."""
+        self._full_due = True
+        await self.async_refresh()
+
+    def _merge_control(self, control: dict) -> dict:
+        """Return the last full data updated with the control state.
+
+        The same object is returned as long as neither lane has new data.
+        """
+        if control is not self._control_data:
+            self._control_data = control
+            self._merged_data = {**self._full_data, **control}
+        return self._merged_data
+
+    async def _async_update_data(self) -> Any:
+        """Update data via library."""
+        self._changed_contexts = None
+        started = time.monotonic()
+        try:
+            data, full = await self._async_fetch_data()
+        except UpdateFailed:
+            # back off while the device is unreachable
+            self._set_polling_interval(self.polling.on_failure())
+            raise
+        now = time.time()
+        data = self.energy.apply(now, data)
+        if full:
+            # the control lane repeats the readings of the last full poll
+            self.telemetry.record(now, data)
+        if self._expected:
+            self._check_expected(data, started)
+        if self._pending_writes or self._expected:
+            data = self._apply_unconfirmed(data, started)
+        if (devices := data.get("devices")) is not None:
+            self._changed_contexts = self.device_lifecycle.process(
+                self._get_device_index(), devices
+            )
+        if self.stale:
+            # everyone drops the stale mark
+            self._changed_contexts = None
+        self._set_polling_interval(self.polling.on_success(time.monotonic(), data, full))
+        data = self._with_polling_interval(data)
+        self.snapshot.schedule_save(data)
+        return data
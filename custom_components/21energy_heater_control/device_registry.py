@@ -3,55 +3,58 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Callable, Type
+from typing import TYPE_CHECKING, Any, Callable, Type
 
 from .api import DeviceApiClientBase, HeaterControlApiClient, PortControlApiClient
 from .const import CONF_DEVICE_TYPE, DEVICE_TYPE_OFEN, DEVICE_TYPE_PORT
-# Sub-package platform modules — imported here at load time (synchronously)
-# so get_platform_setup never calls importlib inside the async event loop.
-from .ofen import binary_sensor as _ofen_binary_sensor
-from .ofen import number as _ofen_number
-from .ofen import sensor as _ofen_sensor
-from .ofen import switch as _ofen_switch
-from .port import binary_sensor as _port_binary_sensor
-from .port import number as _port_number
-from .port import sensor as _port_sensor
-from .port import switch as _port_switch
 
 if TYPE_CHECKING:
+    import contextlib
+
     import aiohttp
+    from homeassistant.core import HomeAssistant
 
 
 @dataclass(frozen=True)
 class DeviceTypeRegistration:
     client_class: Type[DeviceApiClientBase]
-    platforms: dict[str, Callable] = field(default_factory=dict)
+    # platform -> module (relative to the integration) of its async_setup_entry
+    platforms: dict[str, str] = field(default_factory=dict)
 
 
 DEVICE_REGISTRY: dict[str, DeviceTypeRegistration] = {
     DEVICE_TYPE_OFEN: DeviceTypeRegistration(
         client_class=HeaterControlApiClient,
         platforms={
-            "sensor": _ofen_sensor.async_setup_entry,
-            "switch": _ofen_switch.async_setup_entry,
-            "binary_sensor": _ofen_binary_sensor.async_setup_entry,
-            "number": _ofen_number.async_setup_entry,
+            "sensor": ".ofen.sensor",
+            "switch": ".ofen.switch",
+            "binary_sensor": ".ofen.binary_sensor",
+            "number": ".ofen.number",
         },
     ),
     DEVICE_TYPE_PORT: DeviceTypeRegistration(
         client_class=PortControlApiClient,
         platforms={
-            "sensor": _port_sensor.async_setup_entry,
-            "switch": _port_switch.async_setup_entry,
-            "binary_sensor": _port_binary_sensor.async_setup_entry,
-            "number": _port_number.async_setup_entry,
+            "sensor": ".port.sensor",
+            "switch": ".port.switch",
+            "binary_sensor": ".port.binary_sensor",
+            "number": ".port.number",
         },
     ),
 }
 
 
-def create_client(entry_data: dict, session: aiohttp.ClientSession) -> DeviceApiClientBase:
-    """Instantiate the right API client for the device type in entry_data."""
+def create_client(
+    entry_data: dict,
+    session: aiohttp.ClientSession | None = None,
+    limiter: contextlib.AbstractAsyncContextManager[Any] | None = None,
+) -> DeviceApiClientBase:
+    """Instantiate the right API client for the device type in entry_data.
+
+    Without a session the client gets a connection pool of its own, which it
+    releases on async_close. A limiter caps the requests in flight together
+    with the other clients sharing it.
+    """
     from homeassistant.const import CONF_HOST
 
     device_type = entry_data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OFEN)
@@ -60,11 +63,23 @@ def create_client(entry_data: dict, session: aiohttp.ClientSession) -> DeviceApi
         return reg.client_class(
             host=entry_data[CONF_HOST],
             session=session,
+            limiter=limiter,
         )
-    return reg.client_class(host=entry_data[CONF_HOST], session=session)
+    return reg.client_class(host=entry_data[CONF_HOST], session=session, limiter=limiter)
+
+
+async def async_get_platform_setup(
+    hass: HomeAssistant, entry_data: dict, platform: str
+) -> Callable:
+    """Return the async_setup_entry function for the device type + platform.
 
+    The platform modules are only imported for the device types actually
+    configured, in the executor unless already loaded.
+    """
+    from homeassistant.helpers.importlib import async_import_module
 
-def get_platform_setup(entry_data: dict, platform: str) -> Callable:
-    """Return the async_setup_entry function for the device type + platform."""
     device_type = entry_data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OFEN)
-    return DEVICE_REGISTRY[device_type].platforms[platform]
+    module = await async_import_module(
+        hass, f"{__package__}{DEVICE_REGISTRY[device_type].platforms[platform]}"
+    )
+    return module.async_setup_entry
@@ -0,0 +1,44 @@
+"""Diagnostics support for 21energy_heater_control."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import HeaterControlConfigEntry
+
+# Pool user names carry the wallet / account of the owner
+TO_REDACT = {"pool_config"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: HeaterControlConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "host": entry.data[CONF_HOST],
+        "last_update_success": coordinator.last_update_success,
+        "polling": {
+            "interval": coordinator.polling_interval,
+            "next_poll_delay": coordinator.next_poll_delay,
+            "configured_interval": coordinator.polling.interval,
+            "min_interval": coordinator.polling.minimum,
+            "max_interval": coordinator.polling.maximum,
+        },
+        "scheduler": coordinator.scheduler.as_dict(),
+        "transport": client.transport.stats.as_dict(),
+        "circuit": client.transport.circuit.as_dict(),
+        "latency": {
+            endpoint: tracker.as_dict()
+            for endpoint, tracker in client.transport.latencies.items()
+        },
+        "data": async_redact_data(coordinator.data or {}, TO_REDACT),
+    }
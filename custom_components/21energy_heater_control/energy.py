@@ -0,0 +1,124 @@
+"""Energy counters integrated from the reported power consumption."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+# Batch the counter writes, so the disk is not hit on every poll; Home
+# Assistant flushes pending writes when it stops.
+ENERGY_SAVE_DELAY = 300  # seconds
+# Longer gaps between two readings (unreachable device, restart) are not
+# integrated, as the power in between is unknown.
+ENERGY_MAX_GAP = 300  # seconds
+# The totals in the data snapshot move in steps of this size, so a steady
+# consumption does not replace the snapshot on every poll.
+ENERGY_PUBLISH_STEP = 0.01  # kWh
+
+# counter key of the heater / 21PORT as a whole; miners are keyed by their id
+TOTAL = "total"
+
+
+class EnergyAccumulator:
+    """Integrate power readings into kWh counters, one per heater and miner.
+
+    Consecutive readings are integrated with the trapezoidal rule at every
+    refresh. The counters survive restarts through a Store.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, float]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.energy.{entry_id}"
+        )
+        self._totals: dict[str, float] = {}
+        # counter key -> (timestamp, watt) of the last reading
+        self._last: dict[str, tuple[float, float]] = {}
+        self._source: dict | None = None
+        self._published: dict[str, float] = {}
+        self._snapshot: dict | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the persisted counters."""
+        if (stored := await self._store.async_load()) is not None:
+            self._totals = {key: float(value) for key, value in stored.items()}
+
+    async def async_save(self) -> None:
+        """Write the counters now."""
+        await self._store.async_save(self._data_to_save())
+
+    def forget(self, device_id: str) -> None:
+        """Drop the counter of a miner that is gone for good."""
+        if self._totals.pop(device_id, None) is None:
+            return
+        self._last.pop(device_id, None)
+        self._published.pop(device_id, None)
+        self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        # async_delay_save restarts its delay on every call, so with polls
+        # shorter than the delay it would never write
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, ENERGY_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, float]:
+        self._save_pending = False
+        return dict(self._totals)
+
+    def _add(self, key: str, timestamp: float, power: Any) -> None:
+        try:
+            watt = float(power)
+        except (TypeError, ValueError):
+            watt = math.nan
+        if math.isnan(watt) or watt < 0:
+            self._last.pop(key, None)
+            return
+        previous = self._last.get(key)
+        self._last[key] = (timestamp, watt)
+        self._totals.setdefault(key, 0.0)
+        if previous is None:
+            return
+        elapsed = timestamp - previous[0]
+        if 0 < elapsed <= ENERGY_MAX_GAP:
+            self._totals[key] += (previous[1] + watt) / 2 * elapsed / 3_600_000
+        elif elapsed > ENERGY_MAX_GAP:
+            LOGGER.debug("Not integrating %s over a gap of %.0f s", key, elapsed)
+
+    def apply(self, timestamp: float, data: dict) -> dict:
+        """Integrate the power readings of data and return it with the totals.
+
+        The heater total is added as energy_kwh, the total of each 21PORT
+        miner as energyKwh of its device. The same snapshot object is
+        returned as long as data is the same object and no total moved by a
+        publish step.
+        """
+        devices = data.get("devices")
+        self._add(TOTAL, timestamp, data.get("power_consumption"))
+        for device in devices or ():
+            self._add(device["id"], timestamp, device.get("powerConsumptionW"))
+        self._schedule_save()
+
+        published = {
+            key: round(math.floor(total / ENERGY_PUBLISH_STEP) * ENERGY_PUBLISH_STEP, 3)
+            for key, total in self._totals.items()
+        }
+        if data is self._source and published == self._published:
+            return self._snapshot
+        self._source = data
+        self._published = published
+        snapshot = {**data, "energy_kwh": published.get(TOTAL)}
+        if devices is not None:
+            snapshot["devices"] = [
+                {**device, "energyKwh": published.get(device["id"])} for device in devices
+            ]
+        self._snapshot = snapshot
+        return snapshot
@@ -2,21 +2,143 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from numbers import Number
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import HeaterControlDataUpdateCoordinator
 
 
+@dataclass(frozen=True)
+class PublishPolicy:
+    """When a new value of a noisy sensor is worth a state write.
+
+    A numeric value is published once it moved by more than the absolute
+    deadband and by more than the relative one (a fraction of the published
+    value), but not sooner than min_interval seconds after the last write.
+    After heartbeat seconds, the current value is published regardless.
+    Changes of availability are always published. A value held back is
+    checked again once min_interval or heartbeat passed, as the entity may
+    not be updated again by then.
+    """
+
+    deadband: float = 0.0
+    relative_deadband: float = 0.0
+    min_interval: float = 0.0
+    heartbeat: float | None = None
+
+    def should_publish(self, value: Any, published: Any, elapsed: float) -> bool:
+        """Return whether value replaces published, written elapsed seconds ago."""
+        if self.heartbeat is not None and elapsed >= self.heartbeat:
+            return True
+        if value == published or elapsed < self.min_interval:
+            return False
+        if not isinstance(value, Number) or not isinstance(published, Number):
+            return True
+        delta = abs(value - published)
+        return delta > self.deadband and delta > self.relative_deadband * abs(published)
+
+
 class HeaterControlEntity(CoordinatorEntity[HeaterControlDataUpdateCoordinator]):
     """HeaterControlEntity class."""
 
     # _attr_attribution = ATTRIBUTION
 
-    def __init__(self, coordinator: HeaterControlDataUpdateCoordinator) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    # only set on sensors, the policy is applied to their native_value
+    _publish_policy: PublishPolicy | None = None
+
+    def __init__(
+        self,
+        coordinator: HeaterControlDataUpdateCoordinator,
+        context: Any = None,
+    ) -> None:
+        """Initialize.
+
+        Entities of a single 21PORT mining device pass (device id, field) as
+        context to only be updated when that field of the device changed.
+        """
+        super().__init__(coordinator, context)
         self._attr_unique_id = coordinator.entry.entry_id
         self._attr_has_entity_name = True
+        self._written_generation = -1
+        self._published: tuple[Any, bool] | None = None
+        self._published_at = 0.0
+        self._cancel_recheck: Callable[[], None] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state once per coordinator update.
+
+        This is the only coordinator listener of the entity; subclasses must
+        not register another one, but may override _handle_coordinator_update
+        to update their attributes before calling it. Entities with a publish
+        policy skip writes of values that did not change meaningfully.
+        """
+        generation = self.coordinator.generation
+        if generation == self._written_generation:
+            return
+        self._written_generation = generation
+        if self._publish_policy is None:
+            self.async_write_ha_state()
+            return
+        self._async_publish()
+
+    @callback
+    def _async_publish(self, _now: Any = None) -> None:
+        """Write the state if the policy lets it through, and plan the next check."""
+        self._async_cancel_recheck()
+        if self._should_publish():
+            self.async_write_ha_state()
+        if (delay := self._recheck_delay()) is not None:
+            self._cancel_recheck = async_call_later(self.hass, delay, self._async_publish)
+
+    @callback
+    def _async_cancel_recheck(self) -> None:
+        if self._cancel_recheck is not None:
+            self._cancel_recheck()
+            self._cancel_recheck = None
+
+    def _recheck_delay(self) -> float | None:
+        """Return the seconds until the policy may publish without an update."""
+        policy = self._publish_policy
+        elapsed = time.monotonic() - self._published_at
+        held_back = (self.native_value, self.available) != self._published
+        if held_back and elapsed < policy.min_interval:
+            return policy.min_interval - elapsed
+        if policy.heartbeat is not None:
+            return max(policy.heartbeat - elapsed, 0.0)
+        return None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop the pending check of a held back value."""
+        await super().async_will_remove_from_hass()
+        self._async_cancel_recheck()
+
+    def _should_publish(self) -> bool:
+        now = time.monotonic()
+        current = (self.native_value, self.available)
+        if self._published is not None:
+            value, available = self._published
+            if available == current[1] and not self._publish_policy.should_publish(
+                current[0], value, now - self._published_at
+            ):
+                return False
+        self._published = current
+        self._published_at = now
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark states shown from the persisted snapshot until the device answered."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
 
     @property
     def device_info(self) -> dict:
@@ -0,0 +1,113 @@
+"""Lifecycle tracking of the mining devices behind a 21PORT."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import LOGGER
+
+_MISSING = object()
+
+
+@dataclass
+class DeviceEvents:
+    """Mining devices that changed presence in a refresh."""
+
+    # seen for the first time (or again after being forgotten)
+    added: list[dict] = field(default_factory=list)
+    # known devices that are present again after being absent
+    returned: list[dict] = field(default_factory=list)
+    # ids of devices present before, absent now
+    removed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.returned or self.removed)
+
+
+class DeviceLifecycle:
+    """Diff the device list once per refresh and fan the events out to handlers.
+
+    A single pass over the devices yields both the presence events and the
+    (device id, field) pairs whose values changed.
+    """
+
+    def __init__(self) -> None:
+        self._present: set[str] = set()
+        self._known: set[str] = set()
+        self._handlers: list[Callable[[DeviceEvents], None]] = []
+        self._pending = DeviceEvents()
+
+    @property
+    def present(self) -> set[str]:
+        """Ids of the devices present in the latest refresh."""
+        return self._present
+
+    def process(
+        self, old_index: dict[str, dict], devices: list[dict]
+    ) -> set[tuple[str, str]]:
+        """Diff devices against the previous refresh, indexed by old_index.
+
+        Queues the presence events for async_dispatch and returns the changed
+        (device id, field) pairs; all fields of devices that appeared or
+        disappeared count as changed.
+        """
+        changed: set[tuple[str, str]] = set()
+        present: set[str] = set()
+        events = self._pending
+        for device in devices:
+            device_id = device["id"]
+            present.add(device_id)
+            old = old_index.get(device_id)
+            if old is None:
+                changed.update((device_id, key) for key in device)
+            elif old is not device:
+                for key, value in device.items():
+                    if old.get(key, _MISSING) != value:
+                        changed.add((device_id, key))
+                changed.update((device_id, key) for key in old.keys() - device.keys())
+            if device_id not in self._present:
+                if device_id in self._known:
+                    events.returned.append(device)
+                else:
+                    self._known.add(device_id)
+                    events.added.append(device)
+        for device_id in self._present - present:
+            events.removed.append(device_id)
+            old = old_index.get(device_id)
+            if old is not None:
+                changed.update((device_id, key) for key in old)
+        self._present = present
+        return changed
+
+    def forget(self, device_id: str) -> None:
+        """Forget an absent device, so it counts as added if it ever appears again."""
+        self._known.discard(device_id)
+
+    @callback
+    def async_subscribe(
+        self, handler: Callable[[DeviceEvents], None], devices: list[dict]
+    ) -> CALLBACK_TYPE:
+        """Subscribe handler to the events.
+
+        The present ones among devices are handed to it as added right away.
+        """
+        self._handlers.append(handler)
+        if added := [device for device in devices if device["id"] in self._present]:
+            handler(DeviceEvents(added=added))
+        return lambda: self._handlers.remove(handler)
+
+    @callback
+    def async_dispatch(self) -> None:
+        """Hand the events queued by process to the handlers."""
+        events, self._pending = self._pending, DeviceEvents()
+        if not events:
+            return
+        LOGGER.debug(
+            "Mining devices: %s added, %s returned, %s removed",
+            len(events.added), len(events.returned), len(events.removed),
+        )
+        for handler in list(self._handlers):
+            handler(events)
@@ -1,7 +1,8 @@
 """Number platform for 21energy_heater_control."""
 
-from .device_registry import get_platform_setup
+from .device_registry import async_get_platform_setup
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    await get_platform_setup(entry.data, "number")(hass, entry, async_add_entities)
+    setup = await async_get_platform_setup(hass, entry.data, "number")
+    await setup(hass, entry, async_add_entities)
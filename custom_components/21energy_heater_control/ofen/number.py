@@ -69,12 +69,6 @@ class HeaterControlNumber(HeaterControlEntity, NumberEntity):
             f"{DOMAIN}.{self.coordinator.device}.{self.entity_description.key}"
         )
 
-    async def async_added_to_hass(self) -> None:
-        # Ensure we listen for coordinator updates
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
     @property
     def native_value(self) -> float | None:
         """Return the native value of the number."""
@@ -96,8 +90,9 @@ class HeaterControlNumber(HeaterControlEntity, NumberEntity):
 
         if self.entity_description.key == "powertarget":
             api_value = int(round(value - 1))
-            await self.coordinator.entry.runtime_data.client.async_set_powerTarget(
-                api_value
+            client = self.coordinator.entry.runtime_data.client
+            await self.coordinator.async_write(
+                self.entity_description.key,
+                api_value,
+                lambda: client.async_set_powerTarget(api_value),
             )
-
-        await self.coordinator.async_refresh()
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
     SensorEntity,
-    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature, UnitOfPower
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 
 from ..const import DOMAIN
 from ..entity import HeaterControlEntity
+from ..sensor_common import (
+    HASHRATE_PUBLISH,
+    POWER_PUBLISH,
+    TELEMETRY_ATTRIBUTES,
+    ExtSensorEntityDescription,
+    cached_value,
+    data_value,
+    telemetry_attributes,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -22,10 +37,44 @@ if TYPE_CHECKING:
     from ..coordinator import HeaterControlDataUpdateCoordinator
     from ..data import HeaterControlConfigEntry
 
-ALWAYS_AVAILABLE_SENSORS = {"network_name", "network_quality", "pool_1", "pool_2"}
+ALWAYS_AVAILABLE_SENSORS = {
+    "network_name",
+    "network_quality",
+    "pool_1",
+    "pool_2",
+    "energy_kwh",
+    "polling_interval",
+}
+
+
+def _network_name(data: dict) -> str | None:
+    net_status = data.get("network_status")
+    if net_status is None:
+        return None
+    return net_status.get("ssid")
+
+
+def _network_quality(data: dict) -> str | None:
+    net_state = data.get("network_status")
+    if net_state is None:
+        return None
+    return f"{net_state.get('quality')}/{net_state.get('max_quality')}"
+
+
+def _pool(slot: int) -> Callable[[dict], str | None]:
+    def compute(data: dict) -> str | None:
+        pool_conf = data.get("pool_config")
+        if pool_conf is None:
+            return None
+        return f"{pool_conf.get(f'poolUser{slot}')}\n{pool_conf.get(f'poolUrl{slot}')}"
+
+    return compute
+
+
 ENTITY_DESCRIPTIONS = (
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="status_temperature",
+        telemetry="temperature",
         icon="mdi:thermometer",
         entity_registry_enabled_default=True,
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -33,7 +82,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         suggested_display_precision=1,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="powertarget_watt",
         icon="mdi:lightning-bolt-outline",
         entity_registry_enabled_default=True,
@@ -42,7 +91,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_display_precision=0,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="power_limit",
         icon="mdi:lightning-bolt-outline",
         entity_registry_enabled_default=False,
@@ -51,8 +100,10 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_display_precision=0,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="power_consumption",
+        telemetry="power",
+        publish=POWER_PUBLISH,
         icon="mdi:flash",
         entity_registry_enabled_default=True,
         device_class=SensorDeviceClass.POWER,
@@ -60,8 +111,18 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_display_precision=0,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
+        key="energy_kwh",
+        icon="mdi:lightning-bolt",
+        entity_registry_enabled_default=True,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=2,
+    ),
+    ExtSensorEntityDescription(
         key="hashrate_5s",
+        publish=HASHRATE_PUBLISH,
         icon="mdi:numeric",
         entity_registry_enabled_default=False,
         device_class=None,
@@ -69,8 +130,10 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=None,
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="hashrate_1m",
+        telemetry="hashrate",
+        publish=HASHRATE_PUBLISH,
         icon="mdi:numeric",
         entity_registry_enabled_default=True,
         device_class=None,
@@ -78,7 +141,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=None,
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="hashrate_5m",
         icon="mdi:numeric",
         entity_registry_enabled_default=False,
@@ -87,7 +150,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=None,
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="hashrate_15m",
         icon="mdi:numeric",
         entity_registry_enabled_default=False,
@@ -96,7 +159,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=None,
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="hashrate_24h",
         icon="mdi:numeric",
         entity_registry_enabled_default=False,
@@ -105,7 +168,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=None,
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="hashrate_av",
         icon="mdi:numeric",
         entity_registry_enabled_default=False,
@@ -114,7 +177,7 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=None,
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="poolstatus",
         icon="mdi:connection",
         entity_registry_enabled_default=True,
@@ -122,7 +185,7 @@ ENTITY_DESCRIPTIONS = (
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="foundblocks",
         icon="mdi:numeric",
         entity_registry_enabled_default=False,
@@ -130,40 +193,51 @@ ENTITY_DESCRIPTIONS = (
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="network_name",
+        value_fn=cached_value("network_name", _network_name),
         icon="mdi:wifi",
         entity_registry_enabled_default=True,
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
     ),
-
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="network_quality",
+        value_fn=cached_value("network_quality", _network_quality),
         icon="mdi:wifi-strength-2",
         entity_registry_enabled_default=True,
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="pool_1",
+        value_fn=cached_value("pool_1", _pool(1)),
         icon="mdi:pool",
         entity_registry_enabled_default=True,
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="pool_2",
+        value_fn=cached_value("pool_2", _pool(2)),
         icon="mdi:pool",
         entity_registry_enabled_default=False,
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
     ),
-
+    ExtSensorEntityDescription(
+        key="polling_interval",
+        icon="mdi:timer-sync-outline",
+        entity_registry_enabled_default=True,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=None,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+    ),
 )
 
 
@@ -185,14 +259,18 @@ async def async_setup_entry(
 class HeaterControlSensor(HeaterControlEntity, SensorEntity):
     """HeaterControlSensor class."""
 
+    _unrecorded_attributes = TELEMETRY_ATTRIBUTES
+
     def __init__(
             self,
             coordinator: HeaterControlDataUpdateCoordinator,
-            entity_description: SensorEntityDescription,
+            entity_description: ExtSensorEntityDescription,
     ) -> None:
         """Initialize the sensor class."""
         super().__init__(coordinator)
         self.entity_description = entity_description
+        self._value_fn = entity_description.value_fn or data_value(entity_description.key)
+        self._publish_policy = entity_description.publish
         self._attr_translation_key = self.entity_description.key
         self._attr_unique_id = (
             f"{self.coordinator.device}_{self.entity_description.key}"
@@ -204,28 +282,18 @@ class HeaterControlSensor(HeaterControlEntity, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the native value of the sensor."""
-        if self.entity_description.key == "network_name":
-            net_status = self.coordinator.data.get("network_status")
-            if net_status is None:
-                return None
-            return net_status.get("ssid")
-        elif self.entity_description.key == "network_quality":
-            net_state = self.coordinator.data.get("network_status")
-            if net_state is None:
-                return None
-            return f"{net_state.get('quality')}/{net_state.get('max_quality')}"
-        elif self.entity_description.key == "pool_1":
-            pool_conf = self.coordinator.data.get("pool_config")
-            if pool_conf is None:
-                return None
-            return f"{pool_conf.get('poolUser1')}\n{pool_conf.get('poolUrl1')}"
-        elif self.entity_description.key == "pool_2":
-            pool_conf = self.coordinator.data.get("pool_config")
-            if pool_conf is None:
-                return None
-            return f"{pool_conf.get('poolUser2')}\n{pool_conf.get('poolUrl2')}"
-        else:
-            return self.coordinator.data.get(self.entity_description.key)
+        return self._value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float] | None:
+        """Return the recent statistics of the telemetry field of the sensor."""
+        attributes = super().extra_state_attributes
+        if (field := self.entity_description.telemetry) is None:
+            return attributes
+        telemetry = telemetry_attributes(self.coordinator, field)
+        if attributes is None or telemetry is None:
+            return attributes or telemetry
+        return {**attributes, **telemetry}
 
     @property
     def available(self) -> bool:
@@ -233,9 +301,3 @@ class HeaterControlSensor(HeaterControlEntity, SensorEntity):
         if self.entity_description.key in ALWAYS_AVAILABLE_SENSORS or self.coordinator.device_is_running:
             return self.coordinator.last_update_success
         return False
-
-    async def async_added_to_hass(self) -> None:
-        # Ensure we listen for coordinator updates
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
-from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.components.switch import SwitchEntity
 
 from ..const import DOMAIN, LOGGER, STATE_ON, STATE_OFF
 from ..entity import HeaterControlEntity
+from ..switch_common import ExtSwitchEntityDescription
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,11 +18,6 @@ if TYPE_CHECKING:
     from ..data import HeaterControlConfigEntry
 
 
-@dataclass(frozen=True)
-class ExtSwitchEntityDescription(SwitchEntityDescription):
-    icon_off: str | None = None
-
-
 ENTITY_DESCRIPTIONS = (
     ExtSwitchEntityDescription(
         key="enable",
@@ -70,17 +65,19 @@ class HeaterControlSwitch(HeaterControlEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn on the switch."""
-        await self.coordinator.async_set_device_enable(
-            self.entity_description.key, True
-        )
-        self.async_write_ha_state()
+        await self._async_set_enable(True)
 
     async def async_turn_off(self, **kwargs):
         """Turn off the switch."""
-        await self.coordinator.async_set_device_enable(
-            self.entity_description.key, False
+        await self._async_set_enable(False)
+
+    async def _async_set_enable(self, value: bool) -> None:
+        client = self.coordinator.entry.runtime_data.client
+        await self.coordinator.async_write(
+            self.entity_description.key,
+            value,
+            lambda: client.async_set_enable(value),
         )
-        self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool | None:
@@ -114,9 +111,3 @@ class HeaterControlSwitch(HeaterControlEntity, SwitchEntity):
     def available(self) -> bool:
         """Return the availability."""
         return self.coordinator.last_update_success
-
-    async def async_added_to_hass(self) -> None:
-        # Ensure we listen for coordinator updates
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
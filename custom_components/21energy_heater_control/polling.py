@@ -0,0 +1,79 @@
+"""Adaptive polling interval of the coordinator."""
+
+from __future__ import annotations
+
+import math
+
+# Poll at the minimum interval for this long after a write ...
+FAST_POLL_AFTER_WRITE = 60  # seconds
+# ... and after the power consumption moved by more than RAMP_THRESHOLD
+# (relative) between two polls.
+FAST_POLL_WHILE_RAMPING = 30  # seconds
+RAMP_THRESHOLD = 0.05
+# Every poll whose power consumption moved by no more than STEADY_THRESHOLD
+# stretches the interval by STEADY_BACKOFF_FACTOR, up to the maximum.
+STEADY_THRESHOLD = 0.01
+STEADY_BACKOFF_FACTOR = 1.5
+
+
+class PollingPolicy:
+    """Choose the next polling interval from the state of the device.
+
+    - fast (minimum) for a while after writes and while the power ramps
+    - the configured interval while readings change
+    - stretching towards the maximum while readings are steady
+    - the maximum while the device is not running
+    - doubling per failed poll up to the maximum while it is unreachable
+    """
+
+    def __init__(self, interval: float, minimum: float, maximum: float) -> None:
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.interval = min(max(interval, self.minimum), self.maximum)
+        self._fast_until = 0.0
+        self._failures = 0
+        self._steady_interval = self.interval
+        self._last_power: float | None = None
+
+    def note_write(self, now: float) -> None:
+        """Poll fast for a while, a write was sent to the device."""
+        self._fast_until = max(self._fast_until, now + FAST_POLL_AFTER_WRITE)
+
+    def on_failure(self) -> float:
+        """Return the interval after a failed poll."""
+        self._failures += 1
+        self._last_power = None
+        return min(self.maximum, self.interval * 2 ** self._failures)
+
+    def on_success(self, now: float, data: dict, readings: bool = True) -> float:
+        """Return the interval after a successful poll that returned data.
+
+        Without new readings (a poll of the control state only) the power
+        consumption in data is the one already seen, so it neither counts as
+        steady nor as ramping.
+        """
+        self._failures = 0
+        change = None
+        if readings:
+            power = data.get("power_consumption")
+            power = float(power) if isinstance(power, int | float) else None
+            last_power, self._last_power = self._last_power, power
+            if power is not None and last_power is not None:
+                change = abs(power - last_power) / max(abs(last_power), 1.0)
+                if change > RAMP_THRESHOLD:
+                    self._fast_until = max(self._fast_until, now + FAST_POLL_WHILE_RAMPING)
+
+        if now < self._fast_until:
+            self._steady_interval = self.interval
+            return self.minimum
+        if not data.get("status_running"):
+            return self.maximum
+        if not readings:
+            return self._steady_interval
+        if change is not None and change <= STEADY_THRESHOLD:
+            self._steady_interval = min(
+                self.maximum, math.ceil(self._steady_interval * STEADY_BACKOFF_FACTOR)
+            )
+        else:
+            self._steady_interval = self.interval
+        return self._steady_interval
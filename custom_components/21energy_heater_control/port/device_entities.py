@@ -2,31 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from datetime import timedelta
 from typing import TYPE_CHECKING, Literal
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.const import UnitOfPower, UnitOfTemperature
+from homeassistant.const import UnitOfEnergy, UnitOfPower, UnitOfTemperature
 from homeassistant.core import callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_track_time_interval
 
 from ..const import DOMAIN, LOGGER, STATE_OFF, STATE_ON
-from ..entity import HeaterControlEntity
+from ..entity import HeaterControlEntity, PublishPolicy
+from ..sensor_common import HASHRATE_PUBLISH
 
 if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from ..coordinator import HeaterControlDataUpdateCoordinator
     from ..data import HeaterControlConfigEntry
-
-DEVICE_REMOVAL_DELAY = 60  # seconds
-
-
-def _get_device(coordinator: HeaterControlDataUpdateCoordinator, device_id: str) -> dict | None:
-    devices = (coordinator.data or {}).get("devices") or []
-    return next((d for d in devices if d["id"] == device_id), None)
+    from ..lifecycle import DeviceEvents
+
+DEVICE_REMOVAL_DELAY = 2 * 60 * 60  # seconds
+DEVICE_CLEANUP_INTERVAL = 5 * 60  # seconds
+DEVICE_REMOVAL_BATCH_SIZE = 50
+# last part of the unique ids of the per-device entities, which are
+# "<21PORT>_<device id>_<key>"
+DEVICE_ENTITY_KEYS = (
+    "hashrateThs",
+    "powerConsumptionW",
+    "energyKwh",
+    "poolStatus",
+    "chipTemperature",
+    "enabled",
+    "power_level",
+)
 
 
 def _safe_entity_id(device_id: str) -> str:
@@ -47,8 +60,9 @@ class PortDeviceSensor(HeaterControlEntity, SensorEntity):
             device_class: str | None = None,
             state_class: str | None = None,
             icon: str | None = None,
+            publish: PublishPolicy | None = None,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, (device["id"], key))
         self._device_id = device["id"]
         self._key = key
         self._attr_name = f"{device['model']} {label}"
@@ -58,10 +72,11 @@ class PortDeviceSensor(HeaterControlEntity, SensorEntity):
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._attr_icon = icon
+        self._publish_policy = publish
 
     @property
     def native_value(self):
-        device = _get_device(self.coordinator, self._device_id)
+        device = self.coordinator.get_device(self._device_id)
         if device is None:
             return None
         return device.get(self._key)
@@ -70,12 +85,7 @@ class PortDeviceSensor(HeaterControlEntity, SensorEntity):
     def available(self) -> bool:
         return (
                 self.coordinator.last_update_success
-                and _get_device(self.coordinator, self._device_id) is not None
-        )
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+                and self.coordinator.get_device(self._device_id) is not None
         )
 
 
@@ -83,7 +93,7 @@ class PortDeviceSwitch(HeaterControlEntity, SwitchEntity):
     """Switch to enable/disable an individual 21PORT mining device."""
 
     def __init__(self, coordinator: HeaterControlDataUpdateCoordinator, device: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, (device["id"], "enabled"))
         self._device_id = device["id"]
         self._attr_name = f"{device['model']} Enabled"
         self._attr_unique_id = f"{coordinator.device}_{device['id']}_enabled"
@@ -92,7 +102,7 @@ class PortDeviceSwitch(HeaterControlEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        device = _get_device(self.coordinator, self._device_id)
+        device = self.coordinator.get_device(self._device_id)
         if device is None:
             return None
         return device.get("enabled")
@@ -107,26 +117,24 @@ class PortDeviceSwitch(HeaterControlEntity, SwitchEntity):
     def available(self) -> bool:
         return (
                 self.coordinator.last_update_success
-                and _get_device(self.coordinator, self._device_id) is not None
+                and self.coordinator.get_device(self._device_id) is not None
         )
 
     async def async_turn_on(self, **kwargs) -> None:
-        from ..api import PortControlApiClient
-        client = self.coordinator.entry.runtime_data.client
-        assert isinstance(client, PortControlApiClient)
-        await client.async_set_device_enable(self._device_id, True)
-        await self.coordinator.async_refresh()
+        await self._async_set_enabled(True)
 
     async def async_turn_off(self, **kwargs) -> None:
+        await self._async_set_enabled(False)
+
+    async def _async_set_enabled(self, value: bool) -> None:
         from ..api import PortControlApiClient
         client = self.coordinator.entry.runtime_data.client
         assert isinstance(client, PortControlApiClient)
-        await client.async_set_device_enable(self._device_id, False)
-        await self.coordinator.async_refresh()
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+        await self.coordinator.async_write(
+            "enabled",
+            value,
+            lambda: client.async_set_device_enable(self._device_id, value),
+            device_id=self._device_id,
         )
 
 
@@ -134,7 +142,7 @@ class PortDeviceNumber(HeaterControlEntity, NumberEntity):
     """Power level slider for an individual 21PORT mining device."""
 
     def __init__(self, coordinator: HeaterControlDataUpdateCoordinator, device: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, (device["id"], "powerLevel"))
         self._device_id = device["id"]
         self._attr_name = f"{device['model']} Power Level"
         self._attr_unique_id = f"{coordinator.device}_{device['id']}_power_level"
@@ -147,7 +155,7 @@ class PortDeviceNumber(HeaterControlEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        device = _get_device(self.coordinator, self._device_id)
+        device = self.coordinator.get_device(self._device_id)
         if device is None:
             return None
         value = device.get("powerLevel")
@@ -157,7 +165,7 @@ class PortDeviceNumber(HeaterControlEntity, NumberEntity):
     def available(self) -> bool:
         return (
                 self.coordinator.last_update_success
-                and _get_device(self.coordinator, self._device_id) is not None
+                and self.coordinator.get_device(self._device_id) is not None
         )
 
     async def async_set_native_value(self, value: float) -> None:
@@ -167,12 +175,11 @@ class PortDeviceNumber(HeaterControlEntity, NumberEntity):
         from ..api import PortControlApiClient
         client = self.coordinator.entry.runtime_data.client
         assert isinstance(client, PortControlApiClient)
-        await client.async_set_device_power_level(self._device_id, api_value)
-        await self.coordinator.async_refresh()
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+        await self.coordinator.async_write(
+            "powerLevel",
+            api_value,
+            lambda: client.async_set_device_power_level(self._device_id, api_value),
+            device_id=self._device_id,
         )
 
 
@@ -183,6 +190,7 @@ def _sensors_for_device(coordinator: HeaterControlDataUpdateCoordinator, device:
             unit="TH/s",
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:numeric",
+            publish=HASHRATE_PUBLISH,
         ),
         PortDeviceSensor(
             coordinator, device, "powerConsumptionW", "Power Consumption",
@@ -191,6 +199,13 @@ def _sensors_for_device(coordinator: HeaterControlDataUpdateCoordinator, device:
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:flash",
         ),
+        PortDeviceSensor(
+            coordinator, device, "energyKwh", "Energy",
+            unit=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:lightning-bolt",
+        ),
         PortDeviceSensor(
             coordinator, device, "poolStatus", "Pool Status",
             icon="mdi:connection",
@@ -214,23 +229,7 @@ def _numbers_for_device(coordinator: HeaterControlDataUpdateCoordinator, device:
     return [PortDeviceNumber(coordinator, device)]
 
 
-def _platform_tracked(coordinator: HeaterControlDataUpdateCoordinator, platform: str) -> set[str]:
-    """Return a per-platform tracked-device set stored on the coordinator."""
-    attr = f"_device_entity_tracked_{platform}"
-    if not hasattr(coordinator, attr):
-        setattr(coordinator, attr, set())
-    return getattr(coordinator, attr)
-
-
-def _shared_tracked(coordinator: HeaterControlDataUpdateCoordinator) -> set[str]:
-    """Return the union of all per-platform tracked sets (used for cleanup)."""
-    result: set[str] = set()
-    for platform in ("sensors", "switches", "numbers"):
-        result |= _platform_tracked(coordinator, platform)
-    return result
-
-
-def _make_dynamic_setup(entity_factory, platform: str):
+def _make_dynamic_setup(entity_factory):
     """Return a setup function that dynamically registers per-device entities of one platform type."""
 
     def setup(
@@ -238,79 +237,170 @@ def _make_dynamic_setup(entity_factory, platform: str):
             async_add_entities: AddEntitiesCallback,
             entry: HeaterControlConfigEntry,
     ) -> None:
-        tracked = _platform_tracked(coordinator, platform)
-
-        def _handle_update() -> None:
-            devices = (coordinator.data or {}).get("devices") or []
-            new_devices = [d for d in devices if d["id"] not in tracked]
-            if not new_devices:
+        @callback
+        def _handle_devices(events: DeviceEvents) -> None:
+            if not events.added:
                 return
             new_entities: list = []
-            for device in new_devices:
-                tracked.add(device["id"])
+            for device in events.added:
                 new_entities += entity_factory(coordinator, device)
                 LOGGER.debug("Registering %s entities for mining device: %s", entity_factory.__name__, device["id"])
             async_add_entities(new_entities)
 
-        _handle_update()
-        entry.async_on_unload(coordinator.async_add_listener(_handle_update))
+        entry.async_on_unload(
+            coordinator.device_lifecycle.async_subscribe(
+                _handle_devices, (coordinator.data or {}).get("devices") or []
+            )
+        )
 
     return setup
 
 
-setup_dynamic_device_sensors = _make_dynamic_setup(_sensors_for_device, "sensors")
-setup_dynamic_device_switches = _make_dynamic_setup(_switches_for_device, "switches")
-setup_dynamic_device_numbers = _make_dynamic_setup(_numbers_for_device, "numbers")
+setup_dynamic_device_sensors = _make_dynamic_setup(_sensors_for_device)
+setup_dynamic_device_switches = _make_dynamic_setup(_switches_for_device)
+setup_dynamic_device_numbers = _make_dynamic_setup(_numbers_for_device)
+
+
+class _RemovalWheel:
+    """Timing wheel of pending device removals, one slot per sweep interval.
+
+    Scheduling and cancelling are O(1); a sweep pops the due slots only.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._slots: dict[int, set[str]] = {}
+        self._slot_of: dict[str, int] = {}
+
+    def __contains__(self, device_id: str) -> bool:
+        return device_id in self._slot_of
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def schedule(self, device_id: str, when: float) -> None:
+        # round up, so a device is never removed before its delay elapsed
+        slot = -int(-when // self._interval)
+        self._slot_of[device_id] = slot
+        self._slots.setdefault(slot, set()).add(device_id)
+
+    def cancel(self, device_id: str) -> bool:
+        if (slot := self._slot_of.pop(device_id, None)) is None:
+            return False
+        self._slots[slot].discard(device_id)
+        if not self._slots[slot]:
+            del self._slots[slot]
+        return True
+
+    def pop_due(self, now: float) -> set[str]:
+        current = int(now // self._interval)
+        due: set[str] = set()
+        for slot in [slot for slot in self._slots if slot <= current]:
+            due |= self._slots.pop(slot)
+        for device_id in due:
+            del self._slot_of[device_id]
+        return due
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._slot_of.clear()
+
+
+def _registered_device_ids(
+        registry: er.EntityRegistry,
+        coordinator: HeaterControlDataUpdateCoordinator,
+        entry: HeaterControlConfigEntry,
+) -> set[str]:
+    """Return the ids of the mining devices with per-device entities of the entry."""
+    prefix = f"{coordinator.device}_"
+    device_ids: set[str] = set()
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        unique_id = entity.unique_id or ""
+        if not unique_id.startswith(prefix):
+            continue
+        for key in DEVICE_ENTITY_KEYS:
+            suffix = f"_{key}"
+            if unique_id.endswith(suffix) and len(unique_id) > len(prefix) + len(suffix):
+                device_ids.add(unique_id[len(prefix):-len(suffix)])
+                break
+    return device_ids
 
 
 def setup_device_cleanup(
         coordinator: HeaterControlDataUpdateCoordinator,
         entry: HeaterControlConfigEntry,
 ) -> None:
-    """Remove entity registry entries for mining devices absent for 2+ hours."""
+    """Remove entity registry entries for mining devices absent for 2+ hours.
+
+    Departed devices go on a timing wheel that a single periodic sweep
+    drains; the entities of all due devices are looked up among the entries
+    of this config entry and removed in batches, and their energy counters
+    are dropped. The wheel does not survive a restart, so devices that have
+    entities but are missing from the data at setup are put on it anew.
+    """
     hass = coordinator.hass
-    removal_cancels: dict[str, callable] = {}
+    lifecycle = coordinator.device_lifecycle
+    wheel = _RemovalWheel(DEVICE_CLEANUP_INTERVAL)
 
-    def _remove_device_entities(device_id: str) -> None:
+    async def _async_remove_devices(device_ids: set[str]) -> None:
         registry = er.async_get(hass)
-        uid_prefix = f"{coordinator.device}_{device_id}_"
+        prefixes = tuple(f"{coordinator.device}_{device_id}_" for device_id in device_ids)
         to_remove = [
-            e.entity_id for e in registry.entities.values()
-            if (e.unique_id or "").startswith(uid_prefix)
+            e.entity_id
+            for e in er.async_entries_for_config_entry(registry, entry.entry_id)
+            if (e.unique_id or "").startswith(prefixes)
         ]
-        for entity_id in to_remove:
-            LOGGER.debug("Auto-removing entity %s (device absent for 2h)", entity_id)
-            registry.async_remove(entity_id)
-        for platform in ("sensors", "switches", "numbers"):
-            _platform_tracked(coordinator, platform).discard(device_id)
-        removal_cancels.pop(device_id, None)
-
-    def _handle_update() -> None:
-        current_ids = {d["id"] for d in (coordinator.data or {}).get("devices") or []}
-
-        # Cancel pending removals for devices that reappeared
-        for device_id in list(removal_cancels):
-            if device_id in current_ids:
-                LOGGER.debug("Mining device %s reappeared, cancelling removal", device_id)
-                removal_cancels.pop(device_id)()
-
-        # Schedule removal for newly-disappeared known devices
-        tracked = _shared_tracked(coordinator)
-        for device_id in tracked - current_ids:
-            if device_id not in removal_cancels:
+        LOGGER.debug(
+            "Auto-removing %s entities of %s mining device(s) absent for 2h",
+            len(to_remove), len(device_ids),
+        )
+        for start in range(0, len(to_remove), DEVICE_REMOVAL_BATCH_SIZE):
+            if start:
+                # let the event loop breathe between batches
+                await asyncio.sleep(0)
+            for entity_id in to_remove[start:start + DEVICE_REMOVAL_BATCH_SIZE]:
+                if registry.async_get(entity_id) is not None:
+                    registry.async_remove(entity_id)
+        # entities and energy counters start anew should a device come back
+        for device_id in device_ids:
+            lifecycle.forget(device_id)
+            coordinator.energy.forget(device_id)
+
+    async def _async_sweep(_now) -> None:
+        if not wheel:
+            return
+        if due := wheel.pop_due(time.monotonic()):
+            await _async_remove_devices(due)
+
+    @callback
+    def _handle_devices(events: DeviceEvents) -> None:
+        # Cancel pending removals for devices that reappeared; those scheduled
+        # at setup are new to the lifecycle
+        for device in (*events.added, *events.returned):
+            if wheel.cancel(device["id"]):
+                LOGGER.debug("Mining device %s reappeared, cancelling removal", device["id"])
+
+        # Schedule removal for newly-disappeared devices
+        now = time.monotonic()
+        for device_id in events.removed:
+            if device_id not in wheel:
                 LOGGER.debug("Mining device %s gone, scheduling removal in 2h", device_id)
-
-                @callback
-                def _do_remove(_now, did=device_id):
-                    _remove_device_entities(did)
-
-                removal_cancels[device_id] = async_call_later(hass, DEVICE_REMOVAL_DELAY, _do_remove)
-
-    entry.async_on_unload(coordinator.async_add_listener(_handle_update))
-
-    def _cancel_all() -> None:
-        for cancel in removal_cancels.values():
-            cancel()
-        removal_cancels.clear()
-
-    entry.async_on_unload(_cancel_all)
+                wheel.schedule(device_id, now + DEVICE_REMOVAL_DELAY)
+
+    entry.async_on_unload(lifecycle.async_subscribe(_handle_devices, []))
+
+    present = {device["id"] for device in (coordinator.data or {}).get("devices") or ()}
+    if absent := _registered_device_ids(er.async_get(hass), coordinator, entry) - present:
+        LOGGER.debug("Mining devices %s gone, scheduling removal in 2h", sorted(absent))
+        now = time.monotonic()
+        for device_id in absent:
+            wheel.schedule(device_id, now + DEVICE_REMOVAL_DELAY)
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_sweep,
+            timedelta(seconds=DEVICE_CLEANUP_INTERVAL),
+            cancel_on_shutdown=True,
+        )
+    )
+    entry.async_on_unload(wheel.clear)
@@ -6,8 +6,10 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 
+from ..api import PortControlApiClient
 from ..const import DOMAIN, LOGGER
 from ..entity import HeaterControlEntity
+from .device_entities import setup_dynamic_device_numbers
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -44,7 +46,6 @@ async def async_setup_entry(
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
-    from .device_entities import setup_dynamic_device_numbers
     setup_dynamic_device_numbers(entry.runtime_data.coordinator, async_add_entities, entry)
 
 
@@ -76,13 +77,10 @@ class PortNumber(HeaterControlEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         LOGGER.debug("async_set_native_value => power_level:%s-1=%s", value, value - 1)
         api_value = int(round(value - 1))
-        from ..api import PortControlApiClient
         client = self.coordinator.entry.runtime_data.client
         assert isinstance(client, PortControlApiClient)
-        await client.async_set_powerLevel(api_value)
-        await self.coordinator.async_refresh()
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+        await self.coordinator.async_write(
+            self.entity_description.key,
+            api_value,
+            lambda: client.async_set_powerLevel(api_value),
         )
@@ -2,18 +2,32 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
-    SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfPower
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTime,
+)
 
 from ..const import DOMAIN
 from ..entity import HeaterControlEntity
+from ..sensor_common import (
+    POWER_PUBLISH,
+    TELEMETRY_ATTRIBUTES,
+    ExtSensorEntityDescription,
+    cached_value,
+    data_value,
+    telemetry_attributes,
+)
+from .device_entities import setup_device_cleanup, setup_dynamic_device_sensors
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -22,10 +36,27 @@ if TYPE_CHECKING:
     from ..coordinator import HeaterControlDataUpdateCoordinator
     from ..data import HeaterControlConfigEntry
 
-ALWAYS_AVAILABLE_SENSORS = {"device_count", "version", "pool_1", "pool_2"}
+ALWAYS_AVAILABLE_SENSORS = {
+    "device_count",
+    "version",
+    "pool_1",
+    "pool_2",
+    "energy_kwh",
+    "polling_interval",
+}
+
+
+def _pool(slot: int) -> Callable[[dict], str | None]:
+    def compute(data: dict) -> str | None:
+        pool_config = data.get("pool_config") or []
+        p = pool_config[slot] if len(pool_config) > slot else {}
+        return f"{p.get('user')}\n{p.get('url')}" if p else None
+
+    return compute
+
 
 ENTITY_DESCRIPTIONS = (
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="device_count",
         icon="mdi:devices",
         entity_registry_enabled_default=True,
@@ -33,7 +64,7 @@ ENTITY_DESCRIPTIONS = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="pool_status",
         icon="mdi:connection",
         entity_registry_enabled_default=True,
@@ -41,8 +72,10 @@ ENTITY_DESCRIPTIONS = (
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="power_consumption",
+        telemetry="power",
+        publish=POWER_PUBLISH,
         icon="mdi:flash",
         entity_registry_enabled_default=True,
         device_class=SensorDeviceClass.POWER,
@@ -50,8 +83,18 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_display_precision=0,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
+        key="energy_kwh",
+        icon="mdi:lightning-bolt",
+        entity_registry_enabled_default=True,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        suggested_display_precision=2,
+    ),
+    ExtSensorEntityDescription(
         key="total_hashrate",
+        telemetry="hashrate",
         icon="mdi:numeric",
         entity_registry_enabled_default=True,
         device_class=None,
@@ -59,23 +102,25 @@ ENTITY_DESCRIPTIONS = (
         native_unit_of_measurement="TH/s",
         suggested_display_precision=2,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="pool_1",
+        value_fn=cached_value("pool_1", _pool(0)),
         icon="mdi:pool",
         entity_registry_enabled_default=True,
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="pool_2",
+        value_fn=cached_value("pool_2", _pool(1)),
         icon="mdi:pool",
         entity_registry_enabled_default=False,
         device_class=None,
         state_class=None,
         native_unit_of_measurement=None,
     ),
-    SensorEntityDescription(
+    ExtSensorEntityDescription(
         key="version",
         icon="mdi:tag",
         entity_registry_enabled_default=True,
@@ -83,6 +128,15 @@ ENTITY_DESCRIPTIONS = (
         state_class=None,
         native_unit_of_measurement=None,
     ),
+    ExtSensorEntityDescription(
+        key="polling_interval",
+        icon="mdi:timer-sync-outline",
+        entity_registry_enabled_default=True,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=None,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+    ),
 )
 
 
@@ -100,7 +154,6 @@ async def async_setup_entry(
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
-    from .device_entities import setup_dynamic_device_sensors, setup_device_cleanup
     setup_dynamic_device_sensors(entry.runtime_data.coordinator, async_add_entities, entry)
     setup_device_cleanup(entry.runtime_data.coordinator, entry)
 
@@ -108,37 +161,37 @@ async def async_setup_entry(
 class PortSensor(HeaterControlEntity, SensorEntity):
     """Sensor entity for 21port."""
 
+    _unrecorded_attributes = TELEMETRY_ATTRIBUTES
+
     def __init__(
             self,
             coordinator: HeaterControlDataUpdateCoordinator,
-            entity_description: SensorEntityDescription,
+            entity_description: ExtSensorEntityDescription,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = entity_description
+        self._value_fn = entity_description.value_fn or data_value(entity_description.key)
+        self._publish_policy = entity_description.publish
         self._attr_translation_key = self.entity_description.key
         self._attr_unique_id = f"{self.coordinator.device}_{self.entity_description.key}"
         self.entity_id = f"{DOMAIN}.{self.coordinator.device}.{self.entity_description.key}"
 
     @property
     def native_value(self):
-        key = self.entity_description.key
-        if key == "pool_1":
-            pool_config = self.coordinator.data.get("pool_config") or []
-            p = pool_config[0] if len(pool_config) > 0 else {}
-            return f"{p.get('user')}\n{p.get('url')}" if p else None
-        if key == "pool_2":
-            pool_config = self.coordinator.data.get("pool_config") or []
-            p = pool_config[1] if len(pool_config) > 1 else {}
-            return f"{p.get('user')}\n{p.get('url')}" if p else None
-        return self.coordinator.data.get(key)
+        return self._value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float] | None:
+        attributes = super().extra_state_attributes
+        if (field := self.entity_description.telemetry) is None:
+            return attributes
+        telemetry = telemetry_attributes(self.coordinator, field)
+        if attributes is None or telemetry is None:
+            return attributes or telemetry
+        return {**attributes, **telemetry}
 
     @property
     def available(self) -> bool:
         if self.entity_description.key in ALWAYS_AVAILABLE_SENSORS or self.coordinator.device_is_running:
             return self.coordinator.last_update_success
         return False
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
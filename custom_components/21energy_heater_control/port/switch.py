@@ -8,7 +8,8 @@ from homeassistant.components.switch import SwitchEntity
 
 from ..const import DOMAIN, STATE_OFF, STATE_ON
 from ..entity import HeaterControlEntity
-from ..ofen.switch import ExtSwitchEntityDescription
+from ..switch_common import ExtSwitchEntityDescription
+from .device_entities import setup_dynamic_device_switches
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -41,7 +42,6 @@ async def async_setup_entry(
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
-    from .device_entities import setup_dynamic_device_switches
     setup_dynamic_device_switches(entry.runtime_data.coordinator, async_add_entities, entry)
 
 
@@ -60,12 +60,18 @@ class PortSwitch(HeaterControlEntity, SwitchEntity):
         self.entity_id = f"{DOMAIN}.{self.coordinator.device}.{self.entity_description.key}"
 
     async def async_turn_on(self, **kwargs):
-        await self.coordinator.async_set_device_enable(self.entity_description.key, True)
-        self.async_write_ha_state()
+        await self._async_set_enable(True)
 
     async def async_turn_off(self, **kwargs):
-        await self.coordinator.async_set_device_enable(self.entity_description.key, False)
-        self.async_write_ha_state()
+        await self._async_set_enable(False)
+
+    async def _async_set_enable(self, value: bool) -> None:
+        client = self.coordinator.entry.runtime_data.client
+        await self.coordinator.async_write(
+            self.entity_description.key,
+            value,
+            lambda: client.async_set_enable(value),
+        )
 
     @property
     def is_on(self) -> bool | None:
@@ -86,8 +92,3 @@ class PortSwitch(HeaterControlEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         return self.coordinator.last_update_success
-
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
@@ -0,0 +1,103 @@
+"""Integration-wide scheduling of the polls of all config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Requests in flight across all devices of the integration
+GLOBAL_MAX_CONCURRENT_REQUESTS = 8
+# A poll is never moved closer than this fraction of the interval to the
+# previous one; it waits one more interval for its phase instead.
+MIN_DELAY_FRACTION = 0.5
+
+
+class RequestLimiter:
+    """Async context manager capping the requests in flight, and counting them."""
+
+    def __init__(self, limit: int) -> None:
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        self.in_flight += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+class PollScheduler:
+    """Spread the polls of all entries evenly and cap their concurrent requests.
+
+    Every entry gets a phase: entry i of n polls at i/n of its interval, so
+    entries with the same interval take turns instead of polling in bursts.
+    After every poll the coordinator asks for the delay to its next phase.
+    """
+
+    def __init__(self) -> None:
+        self.limiter = RequestLimiter(GLOBAL_MAX_CONCURRENT_REQUESTS)
+        self._entries: list[str] = []
+        self._decisions: dict[str, dict[str, float]] = {}
+
+    @callback
+    def async_register(self, entry_id: str) -> None:
+        """Give the entry a phase; the phases of all entries are spread anew."""
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Release the phase of the entry."""
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+        self._decisions.pop(entry_id, None)
+
+    def phase(self, entry_id: str) -> float:
+        """Return the phase of the entry as a fraction of its interval."""
+        if entry_id not in self._entries:
+            return 0.0
+        return self._entries.index(entry_id) / len(self._entries)
+
+    def delay(self, entry_id: str, interval: float, now: float) -> float:
+        """Return the delay from now to the next poll of the entry at its phase."""
+        offset = self.phase(entry_id) * interval
+        delay = interval - (now - offset) % interval
+        if delay < interval * MIN_DELAY_FRACTION:
+            delay += interval
+        self._decisions[entry_id] = {
+            "interval": interval,
+            "phase": round(self.phase(entry_id), 3),
+            "offset": round(offset, 3),
+            "delay": round(delay, 3),
+        }
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduling decisions for diagnostics."""
+        return {
+            "max_concurrent_requests": GLOBAL_MAX_CONCURRENT_REQUESTS,
+            "requests_in_flight": self.limiter.in_flight,
+            "entries": [
+                {"entry_id": entry_id, **self._decisions.get(entry_id, {})}
+                for entry_id in self._entries
+            ],
+        }
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the scheduler shared by all entries of the integration."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := data.get("scheduler")) is None:
+        LOGGER.debug("Creating the poll scheduler")
+        scheduler = data["scheduler"] = PollScheduler()
+    return scheduler
@@ -0,0 +1,64 @@
+"""Sensor descriptions and helpers shared by the platforms of all device types."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import SensorEntityDescription
+
+from .entity import PublishPolicy
+
+if TYPE_CHECKING:
+    from .coordinator import HeaterControlDataUpdateCoordinator
+
+
+@dataclass(frozen=True)
+class ExtSensorEntityDescription(SensorEntityDescription):
+    # returns the native value; defaults to the coordinator data of the key
+    value_fn: Callable[[HeaterControlDataUpdateCoordinator], Any] | None = None
+    # publish only meaningful changes of noisy values
+    publish: PublishPolicy | None = None
+    # telemetry field whose recent min/max/mean become state attributes
+    telemetry: str | None = None
+
+
+# window of the telemetry statistics in the state attributes
+TELEMETRY_STATS_WINDOW = 15 * 60  # seconds
+# The statistics move on every poll; keep them out of the recorder, which
+# would store a new attributes row for every change.
+TELEMETRY_ATTRIBUTES = frozenset({"min_15m", "max_15m", "mean_15m"})
+
+
+def telemetry_attributes(
+        coordinator: HeaterControlDataUpdateCoordinator, field: str
+) -> dict[str, float] | None:
+    """Return the min/max/mean of a telemetry field over the last 15 minutes."""
+
+    def compute(_data: dict) -> dict[str, float] | None:
+        stats = coordinator.telemetry.stats(field, time.time() - TELEMETRY_STATS_WINDOW)
+        if stats is None:
+            return None
+        return {f"{name}_15m": round(value, 2) for name, value in stats.items()}
+
+    return coordinator.cached(f"telemetry_{field}", compute)
+
+
+# The hashrate and power readings jitter on every poll; write their state
+# only on real changes, and at least every 15 minutes.
+HASHRATE_PUBLISH = PublishPolicy(relative_deadband=0.02, min_interval=30, heartbeat=900)
+POWER_PUBLISH = PublishPolicy(deadband=5, min_interval=30, heartbeat=900)
+
+
+def data_value(key: str) -> Callable[[HeaterControlDataUpdateCoordinator], Any]:
+    """Return a value_fn reading key from the coordinator data."""
+    return lambda coordinator: coordinator.data.get(key)
+
+
+def cached_value(
+        key: str, compute: Callable[[dict], Any]
+) -> Callable[[HeaterControlDataUpdateCoordinator], Any]:
+    """Return a value_fn computing its value once per coordinator generation."""
+    return lambda coordinator: coordinator.cached(key, compute)
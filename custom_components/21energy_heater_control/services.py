@@ -0,0 +1,153 @@
+"""Services for 21energy_heater_control."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import CONF_DEVICE_TYPE, DEVICE_TYPE_PORT, DOMAIN, LOGGER
+from .telemetry import FIELDS, RESOLUTION_RAW, RESOLUTIONS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import HeaterControlConfigEntry
+
+SERVICE_SET_MINERS = "set_miners"
+SERVICE_GET_TELEMETRY = "get_telemetry"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_MINER_IDS = "miner_ids"
+ATTR_MODEL = "model"
+ATTR_MIN_CHIP_TEMPERATURE = "min_chip_temperature"
+ATTR_ENABLED = "enabled"
+ATTR_POWER_LEVEL = "power_level"
+ATTR_RESOLUTION = "resolution"
+ATTR_SINCE = "since"
+
+SET_MINERS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_MINER_IDS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_MODEL): cv.string,
+            vol.Optional(ATTR_MIN_CHIP_TEMPERATURE): vol.Coerce(float),
+            vol.Optional(ATTR_ENABLED): cv.boolean,
+            # same 1-5 scale as the power level number entities
+            vol.Optional(ATTR_POWER_LEVEL): vol.All(vol.Coerce(int), vol.Range(min=1, max=5)),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ENABLED, ATTR_POWER_LEVEL),
+)
+
+GET_TELEMETRY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_RESOLUTION, default=RESOLUTION_RAW): vol.In(list(RESOLUTIONS)),
+        # only samples of this recent period
+        vol.Optional(ATTR_SINCE): cv.positive_time_period,
+    }
+)
+
+
+def _get_entry(hass: HomeAssistant, entry_id: str) -> HeaterControlConfigEntry:
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Config entry {entry_id} is not a loaded {DOMAIN} entry")
+    return entry
+
+
+def _get_port_entry(hass: HomeAssistant, entry_id: str) -> HeaterControlConfigEntry:
+    entry = _get_entry(hass, entry_id)
+    if entry.data.get(CONF_DEVICE_TYPE) != DEVICE_TYPE_PORT:
+        raise ServiceValidationError(f"Config entry {entry_id} is not a 21PORT")
+    return entry
+
+
+def _select_miners(devices: list[dict], data: dict) -> tuple[list[str], list[str]]:
+    """Return the ids of the devices matching the call, and requested ids that are unknown."""
+    miner_ids = data.get(ATTR_MINER_IDS)
+    model = data.get(ATTR_MODEL)
+    min_chip_temperature = data.get(ATTR_MIN_CHIP_TEMPERATURE)
+
+    selected = []
+    for device in devices:
+        if miner_ids is not None and device["id"] not in miner_ids:
+            continue
+        if model is not None and device.get("model") != model:
+            continue
+        if min_chip_temperature is not None:
+            chip_temperature = device.get("chipTemperature")
+            if chip_temperature is None or chip_temperature < min_chip_temperature:
+                continue
+        selected.append(device["id"])
+
+    known = {device["id"] for device in devices}
+    unknown = [miner_id for miner_id in miner_ids or () if miner_id not in known]
+    return selected, unknown
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_set_miners(call: ServiceCall) -> ServiceResponse:
+        """Enable/disable and/or set the power level of many 21PORT miners at once."""
+        entry = _get_port_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        coordinator = entry.runtime_data.coordinator
+        devices = (coordinator.data or {}).get("devices") or []
+        selected, unknown = _select_miners(devices, call.data)
+
+        power_level = call.data.get(ATTR_POWER_LEVEL)
+        LOGGER.debug("set_miners => %s miner(s) selected, %s unknown", len(selected), len(unknown))
+        errors = await entry.runtime_data.client.async_set_devices(
+            selected,
+            enabled=call.data.get(ATTR_ENABLED),
+            power_level=power_level - 1 if power_level is not None else None,
+        )
+        errors.update({miner_id: "Unknown miner" for miner_id in unknown})
+
+        # one refresh for the whole batch; the miners come with the full data only
+        await coordinator.async_refresh_full()
+
+        return {
+            "miners": {
+                miner_id: {"success": error is None, "error": error}
+                for miner_id, error in errors.items()
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_MINERS,
+        async_set_miners,
+        schema=SET_MINERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_get_telemetry(call: ServiceCall) -> ServiceResponse:
+        """Return the in-memory telemetry history of a heater or 21PORT."""
+        entry = _get_entry(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        since = call.data.get(ATTR_SINCE)
+        return {
+            "resolution": call.data[ATTR_RESOLUTION],
+            "fields": list(FIELDS),
+            "samples": entry.runtime_data.coordinator.telemetry.rows(
+                call.data[ATTR_RESOLUTION],
+                time.time() - since.total_seconds() if since is not None else None,
+            ),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TELEMETRY,
+        async_get_telemetry,
+        schema=GET_TELEMETRY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,59 @@
+"""Persisted last good data of a device, to start up without waiting for it."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+# Older snapshots are discarded rather than shown as the state of the device
+SNAPSHOT_MAX_AGE = 6 * 60 * 60  # seconds
+# Batch the writes, the data changes on nearly every poll
+SNAPSHOT_SAVE_DELAY = 120  # seconds
+
+
+class SnapshotStore:
+    """Store of the last data a device returned."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.snapshot.{entry_id}")
+        self._data: dict | None = None
+        self._saved_at = 0.0
+        self._save_pending = False
+
+    async def async_load(self) -> dict | None:
+        """Return the persisted data, unless it is older than SNAPSHOT_MAX_AGE."""
+        stored = await self._store.async_load()
+        if not stored:
+            return None
+        age = time.time() - stored.get("saved_at", 0)
+        if age > SNAPSHOT_MAX_AGE:
+            LOGGER.debug("Discarding snapshot from %.0f s ago", age)
+            return None
+        return stored.get("data")
+
+    def schedule_save(self, data: dict) -> None:
+        """Persist data in a while, batched with the following calls."""
+        self._data = data
+        self._saved_at = time.time()
+        # async_delay_save restarts its delay on every call, so with polls
+        # shorter than the delay it would never write
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the latest data now."""
+        if self._data is not None:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict:
+        self._save_pending = False
+        return {"saved_at": self._saved_at, "data": self._data}
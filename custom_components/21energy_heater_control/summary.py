@@ -0,0 +1,223 @@
+"""Field mapping tables for heater/status/summary responses.
+
+Each row maps a source path in the summary to a key of the coordinator data,
+optionally through a converter. The tables are built once at import into a
+tree of parse functions, one per shared path prefix, so parsing a summary
+looks up every shared prefix (like the last miner summary) once. A row whose
+path is missing, or whose converter rejects the value, is skipped, unless the
+row names a fallback key for malformed values; later rows win over earlier
+ones writing the same key.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+
+class SummaryField(NamedTuple):
+    """Source path -> target key -> converter.
+
+    A converter raises LookupError if the value holds nothing to convert,
+    and TypeError or ValueError if it is malformed; a malformed value is
+    stored as is under fallback, if given.
+    """
+
+    path: tuple[str | int, ...]
+    key: str
+    convert: Callable[[Any], Any] | None = None
+    fallback: str | None = None
+
+
+def _third(value: Any) -> float:
+    # the heaters report the sum over their three miners
+    return value / 3
+
+
+def _gh_to_mh(value: Any) -> float:
+    return float(value) * 1000.0
+
+
+def _gh_to_mh_or_raw(value: Any) -> Any:
+    if value is None:
+        raise TypeError
+    try:
+        return float(value) * 1000.0
+    except (TypeError, ValueError):
+        return value
+
+
+def _timestamp_ms(value: Any) -> int:
+    if not isinstance(value, dict) or "seconds" not in value:
+        raise LookupError("no timestamp")
+    return int(value["seconds"]) * 1000 + int(value.get("nanos", 0)) // 1_000_000
+
+
+def _item(key: str, *, empty: bool = True) -> Callable[[Any], Any]:
+    """Return a converter taking key of a dict, None if the dict lacks it.
+
+    Unless empty, an empty dict holds nothing either.
+    """
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise TypeError
+        if not (value or empty):
+            raise LookupError(key)
+        return value.get(key)
+
+    return convert
+
+
+def _each(key: str) -> Callable[[Any], list]:
+    def convert(value: Any) -> list:
+        if not isinstance(value, list):
+            raise TypeError
+        return [item.get(key) for item in value]
+
+    return convert
+
+
+_LAST = ("miningDevices", "lastSummaries", 0)
+_POOL_STATS = (*_LAST, "pool_stats")
+_REAL_HASHRATE = (*_LAST, "miner_stats", "real_hashrate")
+
+# v0.4.x and up
+FORGE_FIELDS: tuple[SummaryField, ...] = (
+    SummaryField(("miningDevices", "powerTargetW"), "power_limit", _third),
+    SummaryField(("miningDevices", "powerConsumptionW"), "power_consumption"),
+    SummaryField(("miningDevices", "hashRate"), "hashrate_overall_mhs", _gh_to_mh_or_raw),
+    SummaryField(("miningDevices", "maxChipTemperature"), "max_chip_temp"),
+    SummaryField(("miningDevices", "minChipTemperature"), "min_chip_temp"),
+    SummaryField((*_LAST, "id"), "device_id"),
+    # any pool stats at all report every counter, None for the missing ones
+    SummaryField(_POOL_STATS, "accepted_shares", _item("accepted_shares", empty=False)),
+    SummaryField(_POOL_STATS, "rejected_shares", _item("rejected_shares", empty=False)),
+    SummaryField(_POOL_STATS, "stale_shares", _item("stale_shares", empty=False)),
+    SummaryField(_POOL_STATS, "last_difficulty", _item("last_difficulty", empty=False)),
+    SummaryField(_POOL_STATS, "best_share", _item("best_share", empty=False)),
+    SummaryField(_POOL_STATS, "generated_work", _item("generated_work", empty=False)),
+    SummaryField(
+        (*_POOL_STATS, "last_share_time"), "last_share_time_ms", _timestamp_ms, "last_share_time"
+    ),
+    SummaryField((*_LAST, "miner_stats", "found_blocks"), "found_blocks"),
+    SummaryField((*_REAL_HASHRATE, "last_5s", "gigahash_per_second"), "hashrate_5s", _gh_to_mh),
+    SummaryField((*_REAL_HASHRATE, "last_1m", "gigahash_per_second"), "hashrate_1m", _gh_to_mh),
+    SummaryField((*_REAL_HASHRATE, "last_5m", "gigahash_per_second"), "hashrate_5m", _gh_to_mh),
+    SummaryField((*_REAL_HASHRATE, "last_15m", "gigahash_per_second"), "hashrate_15m", _gh_to_mh),
+    SummaryField((*_REAL_HASHRATE, "last_24h", "gigahash_per_second"), "hashrate_24h", _gh_to_mh),
+    # a reasonable "average" fallback: since_restart
+    SummaryField((*_REAL_HASHRATE, "since_restart", "gigahash_per_second"), "hashrate_av", _gh_to_mh),
+    SummaryField((*_LAST, "power_stats", "approximated_consumption", "watt"), "power_consumption"),
+    SummaryField((*_LAST, "power_stats", "efficiency", "joule_per_terahash"), "efficiency_j_per_th"),
+    SummaryField((*_LAST, "fans"), "fan_rpms", _each("rpm")),
+    SummaryField((*_LAST, "fans"), "fan_target_speed_ratios", _each("target_speed_ratio")),
+    SummaryField((*_LAST, "highest_temperature", "temperature"), "highest_chip_temp_c", _item("degree_c")),
+)
+
+# up to v0.3.x
+LEGACY_FIELDS: tuple[SummaryField, ...] = (
+    SummaryField(("foundBlocks",), "foundblocks"),
+    SummaryField(("poolStatus",), "poolstatus"),
+    SummaryField(("power", "limitW"), "power_limit", _third),
+    SummaryField(("power", "approxConsumptionW"), "power_consumption"),
+    SummaryField(("realHashrate", "mhs5S"), "hashrate_5s"),
+    SummaryField(("realHashrate", "mhs1M"), "hashrate_1m"),
+    SummaryField(("realHashrate", "mhs5M"), "hashrate_5m"),
+    SummaryField(("realHashrate", "mhs15M"), "hashrate_15m"),
+    SummaryField(("realHashrate", "mhs24H"), "hashrate_24h"),
+    SummaryField(("realHashrate", "mhsAv"), "hashrate_av"),
+)
+
+
+def _build(fields: tuple[SummaryField, ...]) -> Callable[[Any, dict], None]:
+    """Build the parse function of a field table.
+
+    The paths are merged into a tree with a closure per branching node, which
+    looks up each child, applies the rows ending there and descends further,
+    so every shared prefix (like the last miner summary) is looked up once.
+    Rows are applied depth first; raises ValueError if that would change
+    which of several rows writing a key wins.
+    """
+    tree: dict = {}
+    for index, field in enumerate(fields):
+        node = tree
+        for step in field.path:
+            node = node.setdefault(step, {})
+        node.setdefault(None, []).append(index)
+
+    order: list[int] = []
+
+    def build(node: dict) -> Callable[[Any, dict], None]:
+        # (steps to the next node with rows or branches, its rows, the
+        # parse function of its children)
+        entries = []
+        for step, child in node.items():
+            if step is None:
+                continue
+            steps = [step]
+            while len(child) == 1 and None not in child:
+                ((step, child),) = child.items()
+                steps.append(step)
+            indexes = child.get(None, ())
+            order.extend(indexes)
+            rows = tuple(
+                (fields[index].key, fields[index].convert, fields[index].fallback)
+                for index in indexes
+            )
+            has_children = len(child) > bool(indexes)
+            entries.append((tuple(steps), rows, build(child) if has_children else None))
+
+        def parse(value: Any, data: dict) -> None:
+            for steps, rows, child in entries:
+                child_value = value
+                try:
+                    for step in steps:
+                        child_value = child_value[step]
+                except (LookupError, TypeError):
+                    continue
+                for key, convert, fallback in rows:
+                    if convert is None:
+                        data[key] = child_value
+                        continue
+                    try:
+                        data[key] = convert(child_value)
+                    except LookupError:
+                        pass
+                    except (TypeError, ValueError):
+                        if fallback is not None:
+                            data[fallback] = child_value
+                if child is not None:
+                    child(child_value, data)
+
+        return parse
+
+    parse = build(tree)
+
+    last_writer: dict[str, int] = {}
+    for index in order:
+        key = fields[index].key
+        if last_writer.get(key, -1) > index:
+            msg = f"Rows for {key} would be applied out of order"
+            raise ValueError(msg)
+        last_writer[key] = index
+    return parse
+
+
+class SummaryMapping:
+    """A field table built into a tree of parse functions."""
+
+    __slots__ = ("_parse",)
+
+    def __init__(self, fields: Iterable[SummaryField]) -> None:
+        self._parse = _build(tuple(fields))
+
+    def parse(self, source: Any) -> dict:
+        """Return the mapped fields present in source."""
+        data: dict = {}
+        self._parse(source, data)
+        return data
+
+
+FORGE_SUMMARY = SummaryMapping(FORGE_FIELDS)
+LEGACY_SUMMARY = SummaryMapping(LEGACY_FIELDS)
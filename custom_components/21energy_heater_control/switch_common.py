@@ -0,0 +1,12 @@
+"""Switch descriptions shared by the platforms of all device types."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.components.switch import SwitchEntityDescription
+
+
+@dataclass(frozen=True)
+class ExtSwitchEntityDescription(SwitchEntityDescription):
+    icon_off: str | None = None
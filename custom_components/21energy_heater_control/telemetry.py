@@ -0,0 +1,206 @@
+"""In-memory telemetry history of a heater or 21PORT.
+
+Every successful full poll records one sample of temperature, power,
+hashrate and fan speed into fixed-size ring buffers backed by array("d")
+columns, so recording allocates nothing per sample. The polls in between
+only fetch the control state and record nothing, so there is a sample about
+once a minute (FULL_POLL_INTERVAL), more often right after changes. Samples
+are kept at three resolutions: raw (every full poll), 5 minute means and 15
+minute means.
+
+Memory per device is bounded by the capacities below: each slot holds a
+timestamp and the four fields as 8 byte floats (40 bytes), so
+
+    raw    360 slots x 40 B = 14.4 kB   (about 6 h at one full poll a minute)
+    5 min  288 slots x 40 B = 11.5 kB   (24 h)
+    15 min 672 slots x 40 B = 26.9 kB   (7 days)
+
+about 53 kB per configured device, plus the few bucket accumulators.
+Missing values are stored as NaN.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Callable, Iterator
+
+FIELDS = ("temperature", "power", "hashrate", "fan_speed")
+
+RESOLUTION_RAW = "raw"
+RESOLUTION_5M = "5m"
+RESOLUTION_15M = "15m"
+
+# resolution -> (bucket length in seconds, capacity in slots)
+RESOLUTIONS: dict[str, tuple[int, int]] = {
+    RESOLUTION_RAW: (0, 360),
+    RESOLUTION_5M: (300, 288),
+    RESOLUTION_15M: (900, 672),
+}
+
+NAN = math.nan
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def heater_sample(data: dict) -> tuple[float, ...]:
+    """Return the telemetry fields of a heater snapshot (hashrate in MH/s)."""
+    return (
+        _number(data.get("status_temperature")),
+        _number(data.get("power_consumption")),
+        _number(data.get("hashrate_1m")),
+        _number(data.get("fanspeed")),
+    )
+
+
+def port_sample(data: dict) -> tuple[float, ...]:
+    """Return the telemetry fields of a 21PORT snapshot (hashrate in TH/s).
+
+    The temperature is the hottest chip over all mining devices; the 21PORT
+    reports no fan speed.
+    """
+    temperatures = [_number(d.get("chipTemperature")) for d in data.get("devices") or ()]
+    return (
+        max((t for t in temperatures if not math.isnan(t)), default=NAN),
+        _number(data.get("power_consumption")),
+        _number(data.get("total_hashrate")),
+        NAN,
+    )
+
+
+class RingBuffer:
+    """Fixed-capacity ring of (timestamp, *fields) rows stored column-wise."""
+
+    __slots__ = ("_capacity", "_columns", "_count", "_head", "_timestamps")
+
+    def __init__(self, capacity: int, width: int = len(FIELDS)) -> None:
+        self._capacity = capacity
+        self._timestamps = array("d", [0.0]) * capacity
+        self._columns = tuple(array("d", [NAN]) * capacity for _ in range(width))
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the backing arrays."""
+        return sum(
+            column.itemsize * len(column) for column in (self._timestamps, *self._columns)
+        )
+
+    def append(self, timestamp: float, values: tuple[float, ...]) -> None:
+        """Store a row, overwriting the oldest one once full."""
+        head = self._head
+        self._timestamps[head] = timestamp
+        for column, value in zip(self._columns, values, strict=True):
+            column[head] = value
+        self._head = (head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def _indices(self, since: float | None) -> Iterator[int]:
+        # oldest to newest
+        start = (self._head - self._count) % self._capacity
+        for offset in range(self._count):
+            index = (start + offset) % self._capacity
+            if since is None or self._timestamps[index] >= since:
+                yield index
+
+    def rows(self, since: float | None = None) -> Iterator[tuple[float, ...]]:
+        """Yield the (timestamp, *fields) rows from oldest to newest."""
+        for index in self._indices(since):
+            yield (self._timestamps[index], *(column[index] for column in self._columns))
+
+    def stats(self, field: int, since: float | None = None) -> tuple[float, float, float] | None:
+        """Return (min, max, mean) of a field over the rows since, ignoring NaN."""
+        column = self._columns[field]
+        values = [column[index] for index in self._indices(since)]
+        values = [value for value in values if not math.isnan(value)]
+        if not values:
+            return None
+        return min(values), max(values), sum(values) / len(values)
+
+
+class _Bucket:
+    """Accumulator of the samples of one downsampling interval."""
+
+    __slots__ = ("counts", "start", "sums")
+
+    def __init__(self, width: int) -> None:
+        self.start: float | None = None
+        self.sums = array("d", [0.0]) * width
+        self.counts = array("L", [0]) * width
+
+    def add(self, values: tuple[float, ...]) -> None:
+        for index, value in enumerate(values):
+            if not math.isnan(value):
+                self.sums[index] += value
+                self.counts[index] += 1
+
+    def flush(self) -> tuple[float, ...]:
+        means = tuple(
+            s / c if c else NAN for s, c in zip(self.sums, self.counts, strict=True)
+        )
+        for index in range(len(self.sums)):
+            self.sums[index] = 0.0
+            self.counts[index] = 0
+        return means
+
+
+class TelemetryStore:
+    """Multi-resolution telemetry history of one device."""
+
+    def __init__(self, sample: Callable[[dict], tuple[float, ...]]) -> None:
+        self._sample = sample
+        self._buffers = {
+            resolution: RingBuffer(capacity)
+            for resolution, (_, capacity) in RESOLUTIONS.items()
+        }
+        self._buckets = {
+            resolution: _Bucket(len(FIELDS))
+            for resolution, (interval, _) in RESOLUTIONS.items()
+            if interval
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of all ring buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def record(self, timestamp: float, data: dict) -> None:
+        """Record the telemetry fields of a snapshot taken at timestamp."""
+        values = self._sample(data)
+        self._buffers[RESOLUTION_RAW].append(timestamp, values)
+        for resolution, bucket in self._buckets.items():
+            interval = RESOLUTIONS[resolution][0]
+            start = timestamp - timestamp % interval
+            if bucket.start is not None and bucket.start != start:
+                self._buffers[resolution].append(bucket.start, bucket.flush())
+            bucket.start = start
+            bucket.add(values)
+
+    def rows(self, resolution: str, since: float | None = None) -> list[dict]:
+        """Return the samples of a resolution as dicts, NaN as None."""
+        return [
+            {
+                "timestamp": row[0],
+                **{
+                    field: None if math.isnan(value) else value
+                    for field, value in zip(FIELDS, row[1:], strict=True)
+                },
+            }
+            for row in self._buffers[resolution].rows(since)
+        ]
+
+    def stats(self, field: str, since: float) -> dict[str, float] | None:
+        """Return min/max/mean of a field over the raw samples since."""
+        result = self._buffers[RESOLUTION_RAW].stats(FIELDS.index(field), since)
+        if result is None:
+            return None
+        return dict(zip(("min", "max", "mean"), result, strict=True))
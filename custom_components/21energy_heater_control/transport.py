@@ -0,0 +1,555 @@
+"""HTTP transport shared by the 21energy device API clients."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import random
+import re
+import socket
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any
+
+import aiohttp
+
+from .const import LOGGER
+
+# Upper bound of concurrent requests against a single device. The embedded web
+# servers of the heaters only handle a handful of connections at once.
+MAX_CONCURRENT_REQUESTS_PER_HOST = 4
+
+# Idle connections are kept open for reuse by the next poll. Keep them around
+# for longer than the usual polling interval, but bound how many are pooled.
+KEEPALIVE_TIMEOUT = 75  # seconds
+CONNECTION_POOL_SIZE = MAX_CONCURRENT_REQUESTS_PER_HOST
+
+# Request timeouts follow the observed latency of each endpoint: the 99th
+# percentile of the recent samples times a safety factor, clamped to the bounds.
+# Until enough samples are collected the upper bound applies.
+REQUEST_TIMEOUT_MIN = 0.75  # seconds
+REQUEST_TIMEOUT_MAX = 10  # seconds
+REQUEST_TIMEOUT_FACTOR = 4
+LATENCY_WINDOW = 100  # samples per endpoint
+LATENCY_MIN_SAMPLES = 10
+
+# A completed GET is handed to callers asking for the same endpoint within this
+# window instead of being requested again. Writes end the window.
+DEFAULT_COALESCE_WINDOW = 1.0  # seconds
+
+# A device that fails this many requests in a row is considered unreachable and
+# only probed again after a backoff doubling with every failed probe.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BACKOFF_MIN = 15  # seconds
+CIRCUIT_BACKOFF_MAX = 900  # seconds
+CIRCUIT_BACKOFF_JITTER = 0.2  # +/- share of the backoff
+
+# Time-to-live in seconds of cached GET responses, keyed by the endpoint path
+# below the device's API root. Endpoints that are not listed are never cached.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    "status/system": 3600,
+    "heater/poolConfig": 3600,
+    "heater/networkStatus": 300,
+    "mining/poolConfig": 3600,
+}
+
+
+class HeaterControlApiClientError(Exception):
+    """Exception to indicate a general API error."""
+
+
+class HeaterControlApiClientCommunicationError(
+    HeaterControlApiClientError,
+):
+    """Exception to indicate a communication error."""
+
+
+class HeaterControlApiClientUnavailableError(
+    HeaterControlApiClientCommunicationError,
+):
+    """Exception to indicate that requests are not attempted while the device is unreachable."""
+
+
+class HeaterControlApiClientAuthenticationError(
+    HeaterControlApiClientError,
+):
+    """Exception to indicate an authentication error."""
+
+class HeaterControlApiClientOutdatedError(
+    HeaterControlApiClientError,
+):
+    """Exception to indicate that an expected endpoint is not available. Most likely due to the ofen being outdated."""
+
+
+def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
+    """Verify that the response is valid."""
+    if response.status in (401, 403):
+        msg = "Invalid credentials"
+        raise HeaterControlApiClientAuthenticationError(
+            msg,
+        )
+    elif response.status == 404:
+        raise HeaterControlApiClientOutdatedError()
+    response.raise_for_status()
+
+
+def _parse_body(response: aiohttp.ClientResponse, body: bytes) -> Any:
+    """Decode a response body as JSON if it is announced as such, else as text."""
+    text = body.decode(response.charset or "utf-8", errors="replace")
+    if "application/json" in response.headers.get("Content-Type", ""):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _body_digest(body: bytes) -> bytes:
+    """Return a digest identifying a response body."""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class ResponseCache:
+    """TTL cache for GET responses of slow-changing endpoints."""
+
+    def __init__(self, ttls: dict[str, float] | None = None) -> None:
+        self._ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def is_cacheable(self, path: str) -> bool:
+        """Return True if responses of path are cached at all."""
+        return self._ttls.get(path, 0) > 0
+
+    def get(self, path: str) -> tuple[bool, Any]:
+        """Return (hit, value) for path."""
+        entry = self._entries.get(path)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[path]
+            return False, None
+        return True, value
+
+    def set(self, path: str, value: Any) -> None:
+        """Store value for path if the endpoint is cacheable."""
+        if self.is_cacheable(path):
+            self._entries[path] = (time.monotonic() + self._ttls[path], value)
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached responses of the resource a write to path changes.
+
+        A write to "mining/poolConfig" or "mining/poolConfig/1" invalidates the
+        cached "mining/poolConfig" response.
+        """
+        for cached in list(self._entries):
+            if path == cached or path.startswith(f"{cached}/"):
+                LOGGER.debug("Invalidating cached response of %s", cached)
+                del self._entries[cached]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop sending requests to a device that keeps failing.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive failures the circuit opens and
+    requests fail immediately. Once the backoff has passed, a single request is
+    let through as probe (half-open); it closes the circuit on success and
+    reopens it with a doubled backoff on failure.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        backoff_min: float = CIRCUIT_BACKOFF_MIN,
+        backoff_max: float = CIRCUIT_BACKOFF_MAX,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._backoff_min = backoff_min
+        self._backoff_max = backoff_max
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.retry_at = 0.0
+
+    @property
+    def is_closed(self) -> bool:
+        return self.state is CircuitState.CLOSED
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN and time.monotonic() >= self.retry_at:
+            LOGGER.debug("Circuit half-open, probing device")
+            self.state = CircuitState.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record that the device answered."""
+        if self.state is not CircuitState.CLOSED:
+            LOGGER.info("Device reachable again, closing circuit")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+
+    def record_failure(self, probe: bool = False) -> None:
+        """Record that a request got no answer from the device.
+
+        Only the probe of a half-open circuit reopens it. Failures of requests
+        that were already in flight when the circuit opened are ignored, so
+        one failed poll of several endpoints trips the circuit only once.
+        """
+        if self.state is CircuitState.CLOSED:
+            self.failures += 1
+            if self.failures >= self._failure_threshold:
+                backoff = self._trip()
+                LOGGER.warning(
+                    "Device unreachable after %s failed requests, retrying in %.0f s",
+                    self.failures, backoff,
+                )
+        elif self.state is CircuitState.HALF_OPEN and probe:
+            backoff = self._trip()
+            LOGGER.debug("Probe failed, retrying in %.0f s", backoff)
+
+    def release_probe(self) -> None:
+        """Reopen a half-open circuit whose probe ended without an answer or error.
+
+        This happens when the probe is cancelled; the next request probes again.
+        """
+        if self.state is CircuitState.HALF_OPEN:
+            self.state = CircuitState.OPEN
+
+    def _trip(self) -> float:
+        backoff = min(self._backoff_max, self._backoff_min * 2**self.trips)
+        backoff *= 1 + random.uniform(-CIRCUIT_BACKOFF_JITTER, CIRCUIT_BACKOFF_JITTER)
+        self.state = CircuitState.OPEN
+        self.trips += 1
+        self.retry_at = time.monotonic() + backoff
+        return backoff
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "retry_in": max(0.0, self.retry_at - time.monotonic())
+            if self.state is CircuitState.OPEN else None,
+        }
+
+
+class LatencyTracker:
+    """Rolling latency samples of one endpoint and the timeout derived from them."""
+
+    __slots__ = ("_samples", "_timeout_min", "_timeout_max", "timeout")
+
+    def __init__(self, timeout_min: float, timeout_max: float) -> None:
+        self._samples: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._timeout_min = timeout_min
+        self._timeout_max = timeout_max
+        self.timeout = timeout_max
+
+    def add(self, latency: float) -> None:
+        """Record a latency sample and update the timeout."""
+        self._samples.append(latency)
+        if len(self._samples) >= LATENCY_MIN_SAMPLES:
+            p99 = self.percentile(0.99)
+            self.timeout = min(
+                self._timeout_max,
+                max(self._timeout_min, p99 * REQUEST_TIMEOUT_FACTOR),
+            )
+
+    def percentile(self, q: float) -> float:
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the latency summary for diagnostics."""
+        if not self._samples:
+            return {"samples": 0, "timeout": self.timeout}
+        return {
+            "samples": len(self._samples),
+            "p50": round(self.percentile(0.5), 3),
+            "p99": round(self.percentile(0.99), 3),
+            "timeout": round(self.timeout, 3),
+        }
+
+
+def _endpoint_key(path: str) -> str:
+    """Group paths that only differ in a numeric argument, e.g. powerTarget/3."""
+    return re.sub(r"/\d+(?=/|$)", "/{n}", path)
+
+
+@dataclass
+class TransportStats:
+    """Request and connection counters of a transport."""
+
+    requests: int = 0
+    coalesced_requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+
+    @property
+    def connection_reuse_ratio(self) -> float | None:
+        """Share of requests that were sent over an already open connection."""
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {**asdict(self), "connection_reuse_ratio": self.connection_reuse_ratio}
+
+
+class DeviceTransport:
+    """HTTP transport to the API of a single device.
+
+    Unless a session is passed in, the transport owns a connection pool
+    dedicated to its device, so connections to it are kept alive between polls
+    instead of being set up anew for every request. aiohttp enables TCP_NODELAY
+    on all of its client connections.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        api_root: str,
+        session: aiohttp.ClientSession | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        timeout_min: float = REQUEST_TIMEOUT_MIN,
+        timeout_max: float = REQUEST_TIMEOUT_MAX,
+        limiter: contextlib.AbstractAsyncContextManager[Any] | None = None,
+    ) -> None:
+        self._host = host
+        self._base_url = f"http://{host}/{api_root}/"
+        self._log_prefix = api_root
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_HOST)
+        # shared with the transports of the other devices, if given
+        self._limiter = limiter if limiter is not None else contextlib.nullcontext()
+        self._cache = ResponseCache(cache_ttls)
+        self._coalesce_window = coalesce_window
+        self._inflight: dict[str, asyncio.Task] = {}
+        # incremented when a write starts and when it ends; GETs that overlap
+        # a write do not hand their result to later callers
+        self._write_generation = 0
+        self._recent: dict[str, tuple[float, Any]] = {}
+        self._responses: dict[str, tuple[bytes, Any]] = {}
+        # incremented for every GET response that differs from the previous one
+        self.changed_responses = 0
+        self.stats = TransportStats()
+        self.circuit = CircuitBreaker()
+        self._timeout_min = timeout_min
+        self._timeout_max = timeout_max
+        self.latencies: dict[str, LatencyTracker] = {}
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_POOL_SIZE,
+                limit_per_host=MAX_CONCURRENT_REQUESTS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_create_end)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[trace_config],
+            )
+        return self._session
+
+    async def _on_connection_create_end(self, session, context, params) -> None:
+        self.stats.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, context, params) -> None:
+        self.stats.connections_reused += 1
+
+    async def async_close(self) -> None:
+        """Close the connection pool if the transport owns it."""
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+        self._recent.clear()
+
+    async def async_get(self, path: str) -> Any:
+        """GET an endpoint, served from the cache if still valid.
+
+        Concurrent callers of the same endpoint share a single request, and
+        callers within the coalesce window after it completed share its result.
+        A body byte-identical to the previous response of the endpoint is not
+        decoded again; the previously parsed object is returned instead.
+        """
+        hit, ret = self._cache.get(path)
+        if hit:
+            return ret
+        recent = self._recent.get(path)
+        if recent is not None and time.monotonic() < recent[0]:
+            self.stats.coalesced_requests += 1
+            return recent[1]
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._async_fetch(path))
+            self._inflight[path] = task
+            task.add_done_callback(lambda done: self._async_fetch_done(path, done))
+        else:
+            self.stats.coalesced_requests += 1
+        # shielded, so a cancelled caller does not abort the request of the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, path: str) -> Any:
+        generation = self._write_generation
+        ret = await self._async_request("get", path)
+        # The response may predate a write sent in the meantime; it is still
+        # returned to the callers of this request, but not to later ones.
+        if generation == self._write_generation:
+            self._cache.set(path, ret)
+            if self._coalesce_window > 0:
+                self._recent[path] = (time.monotonic() + self._coalesce_window, ret)
+        return ret
+
+    def _async_fetch_done(self, path: str, task: asyncio.Task) -> None:
+        if self._inflight.get(path) is task:
+            del self._inflight[path]
+        # mark the failure as retrieved, its callers may all have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def async_probe(self, path: str) -> None:
+        """Fail fast, or probe with a single request, while the device is unreachable.
+
+        Does nothing while the circuit is closed.
+        """
+        if not self.circuit.is_closed:
+            await self._async_request("get", path)
+
+    async def async_post(
+        self,
+        path: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+    ) -> Any:
+        """POST to an endpoint and drop cached responses it affects."""
+        self._cache.invalidate(path)
+        # Reads issued from now on must observe the write, so do not hand them
+        # results of, or join, requests made before it or while it is sent.
+        self._write_generation += 1
+        self._recent.clear()
+        self._inflight.clear()
+        try:
+            return await self._async_request("post", path, data=data, headers=headers)
+        finally:
+            self._write_generation += 1
+
+    async def _async_request(
+        self,
+        method: str,
+        path: str,
+        data: dict | None = None,
+        headers: dict | None = None,
+    ) -> Any:
+        """Get information from the API."""
+        if not self.circuit.allow_request():
+            msg = f"{self._host} is unreachable, not sending request"
+            raise HeaterControlApiClientUnavailableError(msg)
+        # this request is the single probe of a half-open circuit
+        probe = self.circuit.state is CircuitState.HALF_OPEN
+        url = f"{self._base_url}{path}"
+        request_headers = {"Host": self._host}
+        if headers:
+            request_headers.update(headers)
+        key = _endpoint_key(path)
+        if (latency := self.latencies.get(key)) is None:
+            latency = self.latencies[key] = LatencyTracker(self._timeout_min, self._timeout_max)
+        try:
+            async with self._semaphore, self._limiter, asyncio.timeout(latency.timeout):
+                self.stats.requests += 1
+                started = time.monotonic()
+                response = await self._get_session().request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    json=data,
+                )
+                self.circuit.record_success()
+                LOGGER.debug(
+                    "%s request => %s %s => status:%s",
+                    self._log_prefix, method.upper(), url, response.status,
+                )
+                _verify_response_or_raise(response)
+                body = await response.read()
+                latency.add(time.monotonic() - started)
+                if method != "get":
+                    ret = _parse_body(response, body)
+                    LOGGER.debug("%s request => url:%s => response:%s", self._log_prefix, url, ret)
+                    return ret
+                # Skip decoding a body that is byte-identical to the previous
+                # one of this url and hand out the previously parsed result.
+                digest = _body_digest(body)
+                previous = self._responses.get(url)
+                if previous is not None and previous[0] == digest:
+                    LOGGER.debug("%s request => url:%s => unchanged", self._log_prefix, url)
+                    return previous[1]
+                ret = _parse_body(response, body)
+                self._responses[url] = (digest, ret)
+                self.changed_responses += 1
+                LOGGER.debug("%s request => url:%s => response:%s", self._log_prefix, url, ret)
+                return ret
+
+        except TimeoutError as exception:
+            msg = f"Timeout error fetching information after {latency.timeout:.2f} s - {exception}"
+            # count the timeout as a sample, so a device that became slower
+            # gets more time on the next attempts
+            latency.add(latency.timeout)
+            self.circuit.record_failure(probe)
+            raise HeaterControlApiClientCommunicationError(
+                msg,
+            ) from exception
+        except (aiohttp.ClientError, socket.gaierror) as exception:
+            if isinstance(exception, (aiohttp.ClientConnectionError, socket.gaierror)):
+                self.circuit.record_failure(probe)
+            msg = f"Error fetching information - {exception}"
+            raise HeaterControlApiClientCommunicationError(
+                msg,
+            ) from exception
+        except HeaterControlApiClientError as e:
+            raise e
+        except Exception as exception:  # pylint: disable=broad-except
+            msg = f"Something really wrong happened! - {exception}"
+            raise HeaterControlApiClientError(
+                msg,
+            ) from exception
+        finally:
+            # A probe that was cancelled, e.g. by the time budget of the poll,
+            # recorded neither outcome; do not leave the circuit half-open.
+            if probe:
+                self.circuit.release_probe()
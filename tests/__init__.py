@@ -0,0 +1,20 @@
+"""Tests for the 21energy Heater Control integration."""
+
+import importlib
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+PACKAGE = "custom_components.21energy_heater_control"
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def integration_module(name: str) -> ModuleType:
+    """Import a module of the integration; its package name is no valid identifier."""
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+def load_fixture(name: str) -> Any:
+    """Return the parsed JSON fixture name."""
+    return json.loads((FIXTURES / name).read_text())
@@ -0,0 +1,9 @@
+"""Fixtures for the 21energy Heater Control tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the custom integration in every test."""
+    return
@@ -0,0 +1,154 @@
+"""The status summary parser as it was before the field tables of summary.py.
+
+Kept as reference for the parity tests and the parser benchmark; the body is
+the one of HeaterControlApiClient.async_get_data at the time, with the
+combination with the operational status left to the caller.
+"""
+
+from __future__ import annotations
+
+
+def parse_status_summary(status_summary: dict) -> dict:
+    """Extract the fields of a heater/status/summary response."""
+    data = {}
+    if "forge" in status_summary:
+        # guard for missing keys
+        data["status_running"] = status_summary.get("miningDevices", {}).get("enabled") == 1
+
+        mining = status_summary.get("miningDevices", {})
+        last_summaries = mining.get("lastSummaries") or []
+        last = last_summaries[0] if len(last_summaries) > 0 else {}
+
+        # --- Mining device top-level values ---
+        # power target / consumption at device level
+        if "powerTargetW" in mining:
+            data["power_limit"] = mining.get("powerTargetW") / 3
+        if "powerConsumptionW" in mining:
+            data["power_consumption"] = mining.get("powerConsumptionW")
+
+        # overall hash rate (device-level reported as gigahash/s) -> convert to MH/s
+        if "hashRate" in mining and mining["hashRate"] is not None:
+            try:
+                data["hashrate_overall_mhs"] = float(mining["hashRate"]) * 1000.0
+            except Exception:
+                data["hashrate_overall_mhs"] = mining.get("hashRate")
+
+        # chip temps (top-level)
+        if "maxChipTemperature" in mining:
+            data["max_chip_temp"] = mining.get("maxChipTemperature")
+        if "minChipTemperature" in mining:
+            data["min_chip_temp"] = mining.get("minChipTemperature")
+
+        # device id (from last summary if present)
+        if "id" in last:
+            data["device_id"] = last.get("id")
+
+        # --- Parse last summary blocks if present ---
+        # Pool stats
+        pool = last.get("pool_stats") or {}
+        if pool:
+            data["accepted_shares"] = pool.get("accepted_shares")
+            data["rejected_shares"] = pool.get("rejected_shares")
+            data["stale_shares"] = pool.get("stale_shares")
+            data["last_difficulty"] = pool.get("last_difficulty")
+            data["best_share"] = pool.get("best_share")
+            data["generated_work"] = pool.get("generated_work")
+            # last_share_time -> convert to ms epoch if present
+            lst = pool.get("last_share_time")
+            if isinstance(lst, dict) and "seconds" in lst:
+                try:
+                    data["last_share_time_ms"] = int(lst.get("seconds", 0)) * 1000 + int(
+                        lst.get("nanos", 0)) // 1_000_000
+                except Exception:
+                    data["last_share_time"] = lst
+
+        # Miner stats
+        miner = last.get("miner_stats") or {}
+        if miner:
+            # found blocks
+            if "found_blocks" in miner:
+                data["found_blocks"] = miner.get("found_blocks")
+
+            # real_hashrate provides multiple windows in GH/s -> convert to MH/s
+            real = miner.get("real_hashrate") or {}
+
+            def _gh_to_mh(d, path_keys):
+                # safe accessor: returns value in GH/s converted to MH/s
+                cur = d
+                try:
+                    for k in path_keys:
+                        cur = cur[k]
+                    return float(cur) * 1000.0
+                except Exception:
+                    return None
+
+            # Map windows (examples from response: last_5s, last_1m, last_5m, last_15m, last_24h, since_restart)
+            v = _gh_to_mh(real, ["last_5s", "gigahash_per_second"])
+            if v is not None:
+                data["hashrate_5s"] = v
+            v = _gh_to_mh(real, ["last_1m", "gigahash_per_second"])
+            if v is not None:
+                data["hashrate_1m"] = v
+            v = _gh_to_mh(real, ["last_5m", "gigahash_per_second"])
+            if v is not None:
+                data["hashrate_5m"] = v
+            v = _gh_to_mh(real, ["last_15m", "gigahash_per_second"])
+            if v is not None:
+                data["hashrate_15m"] = v
+            v = _gh_to_mh(real, ["last_24h", "gigahash_per_second"])
+            if v is not None:
+                data["hashrate_24h"] = v
+            # a reasonable "average" fallback: since_restart
+            v = _gh_to_mh(real, ["since_restart", "gigahash_per_second"])
+            if v is not None:
+                data["hashrate_av"] = v
+
+        # Power stats (from the summary block)
+        power = last.get("power_stats") or {}
+        approxs = power.get("approximated_consumption") or {}
+        if "watt" in approxs:
+            data["power_consumption"] = approxs.get("watt")
+        eff = power.get("efficiency") or {}
+        if "joule_per_terahash" in eff:
+            data["efficiency_j_per_th"] = eff.get("joule_per_terahash")
+
+        # Fans / temps
+        fans = last.get("fans")
+        if isinstance(fans, list):
+            # list of rpms and target ratios
+            data["fan_rpms"] = [f.get("rpm") for f in fans]
+            data["fan_target_speed_ratios"] = [f.get("target_speed_ratio") for f in fans]
+
+        highest_temp = last.get("highest_temperature") or {}
+        if "temperature" in highest_temp and isinstance(highest_temp["temperature"], dict):
+            data["highest_chip_temp_c"] = highest_temp["temperature"].get("degree_c")
+
+    # end if "forge" in status_summary
+    else:
+        for key in status_summary:
+            if key in ["foundBlocks", "poolStatus"]:
+                data[key.lower()] = status_summary[key]
+            elif key == "power":
+                power = status_summary[key] or {}
+                if "limitW" in power:
+                    data["power_limit"] = power["limitW"] / 3
+                if "approxConsumptionW" in power:
+                    data["power_consumption"] = power["approxConsumptionW"]
+            elif key == "realHashrate":
+                hr = status_summary[key] or {}
+                if "mhs5S" in hr:
+                    data["hashrate_5s"] = hr["mhs5S"]
+                if "mhs1M" in hr:
+                    data["hashrate_1m"] = hr["mhs1M"]
+                if "mhs5M" in hr:
+                    data["hashrate_5m"] = hr["mhs5M"]
+                if "mhs15M" in hr:
+                    data["hashrate_15m"] = hr["mhs15M"]
+                if "mhs24H" in hr:
+                    data["hashrate_24h"] = hr["mhs24H"]
+                if "mhsAv" in hr:
+                    data["hashrate_av"] = hr["mhsAv"]
+
+        data["status_running"] = "tunerStatus" in status_summary
+
+    return data
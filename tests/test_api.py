@@ -0,0 +1,41 @@
+"""Tests of the API clients."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from . import integration_module
+
+api = integration_module("api")
+
+
+async def test_gather_cancels_the_others_on_failure() -> None:
+    """A failed request cancels its siblings before the failure propagates."""
+    sibling_cancelled = asyncio.Event()
+
+    async def fail() -> None:
+        raise api.HeaterControlApiClientCommunicationError("unreachable")
+
+    async def hang() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    with pytest.raises(api.HeaterControlApiClientCommunicationError):
+        await api._gather(hang(), fail(), hang())
+
+    assert sibling_cancelled.is_set()
+
+
+async def test_gather_returns_the_results_in_order() -> None:
+    """Without failures it behaves like asyncio.gather."""
+
+    async def value(number: int) -> int:
+        await asyncio.sleep(0)
+        return number
+
+    assert await api._gather(value(1), value(2), value(3)) == [1, 2, 3]
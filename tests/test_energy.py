@@ -0,0 +1,33 @@
+"""Tests of the energy counters."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from . import integration_module
+
+energy = integration_module("energy")
+
+
+def _data(*miner_ids: str) -> dict:
+    return {
+        "power_consumption": 3600.0 * len(miner_ids),
+        "devices": [{"id": miner_id, "powerConsumptionW": 3600.0} for miner_id in miner_ids],
+    }
+
+
+async def test_forgotten_miner_counter_is_dropped(hass: HomeAssistant) -> None:
+    """The counter of a removed miner is no longer kept nor saved."""
+    accumulator = energy.EnergyAccumulator(hass, "entry")
+    accumulator.apply(0.0, _data("a", "b"))
+    accumulator.apply(60.0, _data("a", "b"))
+    accumulator.apply(120.0, _data("a"))
+
+    accumulator.forget("b")
+
+    saved = accumulator._data_to_save()
+    assert set(saved) == {energy.TOTAL, "a"}
+    assert saved["a"] == 0.12
+    # a miner coming back starts counting anew
+    snapshot = accumulator.apply(180.0, _data("a", "b"))
+    assert [device["energyKwh"] for device in snapshot["devices"]] == [0.18, 0.0]
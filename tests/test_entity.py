@@ -0,0 +1,237 @@
+"""Tests of the state writes of the entities per coordinator refresh."""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from . import PACKAGE, integration_module
+
+const = integration_module("const")
+entity = integration_module("entity")
+sensor_common = integration_module("sensor_common")
+
+
+class _Client:
+    """API client handing out the data it was given."""
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+
+    async def async_get_data(self) -> dict:
+        return self.data
+
+    async def async_get_control_data(self) -> dict:
+        return self.data
+
+    async def async_close(self) -> None:
+        pass
+
+
+def _heater_data(step: int) -> dict:
+    return {
+        "status": True,
+        "status_running": True,
+        "enable": True,
+        "fanspeed": 40 + step,
+        "powertarget": 1,
+        "powertarget_watt": 1000,
+        "status_temperature": 45.0 + step,
+        "network_status": {"ssid": "heater", "quality": 50, "max_quality": 70},
+        "pool_config": {"poolUser1": "user", "poolUrl1": "stratum+tcp://pool"},
+        "power_consumption": 3000.0 + 500 * step,
+        "hashrate_5s": 1.0e8 * (1 + step),
+        "heater": {},
+    }
+
+
+def _miner(miner_id: str, step: int) -> dict:
+    return {
+        "id": miner_id,
+        "model": "S19",
+        "enabled": True,
+        "powerLevel": 2,
+        "hashrateThs": 100.0 * (1 + step),
+        "powerConsumptionW": 3000.0 + 500 * step,
+        "chipTemperature": 60.0 + step,
+        "poolStatus": "alive",
+    }
+
+
+def _port_data(steps: dict[str, int]) -> dict:
+    return {
+        "version": "1.0.0",
+        "device_count": len(steps),
+        "forge_status": "running",
+        "forge_reachable": True,
+        "status_running": True,
+        "pool_status": "alive",
+        "pool_alive": True,
+        "power_level": 2,
+        "power_consumption": 3000.0 * len(steps) + 500 * sum(steps.values()),
+        "total_hashrate": 100.0 * len(steps) + 100 * sum(steps.values()),
+        "mining_enabled": True,
+        "enable": True,
+        "devices": [_miner(miner_id, step) for miner_id, step in steps.items()],
+        "pool_config": [{"user": "user", "url": "stratum+tcp://pool"}],
+    }
+
+
+ENTRY_DATA = {
+    const.DEVICE_TYPE_OFEN: {
+        CONF_HOST: "heater.local",
+        const.CONF_POLLING_INTERVAL: 30,
+        const.CONF_DEVICE_TYPE: const.DEVICE_TYPE_OFEN,
+        "model": "21control",
+        "version": "1.0.0",
+        "product_id": "HEATER1",
+    },
+    const.DEVICE_TYPE_PORT: {
+        CONF_HOST: "port.local",
+        const.CONF_POLLING_INTERVAL: 30,
+        const.CONF_DEVICE_TYPE: const.DEVICE_TYPE_PORT,
+        "model": "21PORT",
+        "version": "1.0.0",
+    },
+}
+
+
+async def _setup(hass: HomeAssistant, device_type: str, data: dict) -> tuple:
+    entry = MockConfigEntry(
+        domain=const.DOMAIN, title=device_type, data=ENTRY_DATA[device_type]
+    )
+    entry.add_to_hass(hass)
+    client = _Client(data)
+    with patch(f"{PACKAGE}.create_client", return_value=client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry, client
+
+
+def _enabled_entities(hass: HomeAssistant, entry: MockConfigEntry) -> dict[str, str]:
+    """Return the entity ids of the enabled entities of entry by unique id."""
+    return {
+        registry_entry.unique_id: registry_entry.entity_id
+        for registry_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if registry_entry.disabled_by is None
+    }
+
+
+@pytest.fixture
+def writes(monkeypatch: pytest.MonkeyPatch) -> Counter:
+    """Count the state writes per entity id."""
+    counter: Counter = Counter()
+    write = entity.HeaterControlEntity.async_write_ha_state
+
+    def counting_write(self) -> None:
+        counter[self.entity_id] += 1
+        write(self)
+
+    monkeypatch.setattr(entity.HeaterControlEntity, "async_write_ha_state", counting_write)
+    return counter
+
+
+async def _refresh(hass: HomeAssistant, entry: MockConfigEntry, client: _Client, data: dict) -> None:
+    client.data = data
+    await entry.runtime_data.coordinator.async_refresh_full()
+    await hass.async_block_till_done()
+
+
+async def test_heater_entities_write_once_per_refresh(hass: HomeAssistant, writes: Counter) -> None:
+    """Every heater entity writes its state exactly once per refresh."""
+    entry, client = await _setup(hass, const.DEVICE_TYPE_OFEN, _heater_data(0))
+    entities = _enabled_entities(hass, entry).values()
+    assert entities
+
+    await _refresh(hass, entry, client, _heater_data(1))
+
+    assert writes == Counter(dict.fromkeys(entities, 1))
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_repeated_notification_writes_once(hass: HomeAssistant, writes: Counter) -> None:
+    """Listeners called again within the same generation do not write again."""
+    entry, client = await _setup(hass, const.DEVICE_TYPE_OFEN, _heater_data(0))
+    entities = _enabled_entities(hass, entry).values()
+    coordinator = entry.runtime_data.coordinator
+
+    await _refresh(hass, entry, client, _heater_data(1))
+    for update_callback, _context in list(coordinator._listeners.values()):
+        update_callback()
+    await hass.async_block_till_done()
+
+    assert writes == Counter(dict.fromkeys(entities, 1))
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_port_entities_write_once_per_refresh(hass: HomeAssistant, writes: Counter) -> None:
+    """The 21PORT and per-miner entities write once, miners only if they changed.
+
+    The second refresh comes within the min_interval of the hashrate policy,
+    so only the unthrottled fields of miner a are written again.
+    """
+    entry, client = await _setup(hass, const.DEVICE_TYPE_PORT, _port_data({"a": 0, "b": 0}))
+    entities = _enabled_entities(hass, entry)
+    miner_b = {
+        entity_id for unique_id, entity_id in entities.items() if unique_id.startswith("port.local_b_")
+    }
+    assert miner_b
+
+    await _refresh(hass, entry, client, _port_data({"a": 1, "b": 1}))
+
+    assert writes == Counter(dict.fromkeys(entities.values(), 1))
+
+    writes.clear()
+    await _refresh(hass, entry, client, _port_data({"a": 2, "b": 1}))
+
+    assert max(writes.values()) == 1
+    assert not miner_b & set(writes)
+    assert writes[entities["port.local_a_chipTemperature"]] == 1
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_throttled_value_is_published_later(
+    hass: HomeAssistant, writes: Counter, freezer: FrozenDateTimeFactory
+) -> None:
+    """A change held back by min_interval is written once it passed, without a refresh."""
+    entry, client = await _setup(hass, const.DEVICE_TYPE_PORT, _port_data({"a": 0, "b": 0}))
+    hashrate = _enabled_entities(hass, entry)["port.local_a_hashrateThs"]
+    await _refresh(hass, entry, client, _port_data({"a": 1, "b": 0}))
+    writes.clear()
+
+    await _refresh(hass, entry, client, _port_data({"a": 2, "b": 0}))
+    assert writes[hashrate] == 0
+    assert float(hass.states.get(hashrate).state) == 200.0
+
+    freezer.tick(timedelta(seconds=sensor_common.HASHRATE_PUBLISH.min_interval + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert writes[hashrate] == 1
+    assert float(hass.states.get(hashrate).state) == 300.0
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_heartbeat_writes_steady_values(
+    hass: HomeAssistant, writes: Counter, freezer: FrozenDateTimeFactory
+) -> None:
+    """A value that does not change is written again after the heartbeat."""
+    entry, client = await _setup(hass, const.DEVICE_TYPE_PORT, _port_data({"a": 0, "b": 0}))
+    hashrate = _enabled_entities(hass, entry)["port.local_a_hashrateThs"]
+    await _refresh(hass, entry, client, _port_data({"a": 1, "b": 0}))
+    writes.clear()
+
+    freezer.tick(timedelta(seconds=sensor_common.HASHRATE_PUBLISH.heartbeat + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert writes[hashrate] == 1
+    assert await hass.config_entries.async_unload(entry.entry_id)
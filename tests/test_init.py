@@ -0,0 +1,62 @@
+"""Tests of the setup and unload of config entries."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from . import PACKAGE, integration_module
+
+api = integration_module("api")
+const = integration_module("const")
+
+ENTRY_DATA = {
+    CONF_HOST: "heater.local",
+    const.CONF_POLLING_INTERVAL: 30,
+    const.CONF_DEVICE_TYPE: const.DEVICE_TYPE_OFEN,
+    "model": "21control",
+    "version": "1.0.0",
+    "product_id": "HEATER1",
+}
+
+
+def _client(**kwargs) -> AsyncMock:
+    return AsyncMock(spec=api.HeaterControlApiClient, **kwargs)
+
+
+async def test_failed_setup_closes_the_client(hass: HomeAssistant) -> None:
+    """A setup to be retried does not leave the connection pool open."""
+    entry = MockConfigEntry(domain=const.DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+    client = _client()
+    client.async_get_data.side_effect = api.HeaterControlApiClientCommunicationError("down")
+
+    with patch(f"{PACKAGE}.create_client", return_value=client):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    client.async_close.assert_awaited_once()
+
+
+async def test_stop_closes_the_client(hass: HomeAssistant) -> None:
+    """The connection pool is closed when Home Assistant stops."""
+    entry = MockConfigEntry(domain=const.DOMAIN, data=ENTRY_DATA)
+    entry.add_to_hass(hass)
+    client = _client()
+    client.async_get_data.return_value = {"status": True, "status_running": True}
+
+    with patch(f"{PACKAGE}.create_client", return_value=client):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    client.async_close.assert_not_awaited()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    client.async_close.assert_awaited_once()
+    assert await hass.config_entries.async_unload(entry.entry_id)
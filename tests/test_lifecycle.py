@@ -0,0 +1,154 @@
+"""Tests of the 21PORT miner lifecycle."""
+
+from __future__ import annotations
+
+import random
+
+from . import integration_module
+
+lifecycle = integration_module("lifecycle")
+
+
+def _device(device_id: str, **fields) -> dict:
+    return {"id": device_id, "enabled": True, "powerLevel": 2, **fields}
+
+
+def _index(devices: list[dict]) -> dict[str, dict]:
+    return {device["id"]: device for device in devices}
+
+
+class _Recorder:
+    """Handler keeping the events it was handed."""
+
+    def __init__(self) -> None:
+        self.events: list = []
+
+    def __call__(self, events) -> None:
+        self.events.append(events)
+
+
+def _refresh(tracker, old: list[dict], new: list[dict]) -> set[tuple[str, str]]:
+    changed = tracker.process(_index(old), new)
+    tracker.async_dispatch()
+    return changed
+
+
+def test_first_refresh_adds_every_device() -> None:
+    """All devices and all their fields are new at first."""
+    tracker = lifecycle.DeviceLifecycle()
+    recorder = _Recorder()
+    tracker.async_subscribe(recorder, [])
+    devices = [_device("a"), _device("b")]
+
+    changed = _refresh(tracker, [], devices)
+
+    assert changed == {
+        (device_id, key) for device_id in "ab" for key in ("id", "enabled", "powerLevel")
+    }
+    assert [events.added for events in recorder.events] == [devices]
+    assert tracker.present == {"a", "b"}
+
+
+def test_changed_fields_only() -> None:
+    """Only the fields whose value changed, or that went missing, count."""
+    tracker = lifecycle.DeviceLifecycle()
+    a, b = _device("a"), _device("b", poolStatus="Alive")
+    _refresh(tracker, [], [a, b])
+
+    new_a = {**a, "powerLevel": 3}
+    new_b = _device("b")
+    changed = _refresh(tracker, [a, b], [new_a, new_b])
+
+    assert changed == {("a", "powerLevel"), ("b", "poolStatus")}
+
+
+def test_same_device_objects_are_skipped() -> None:
+    """A device list handed out again yields neither changes nor events."""
+    tracker = lifecycle.DeviceLifecycle()
+    recorder = _Recorder()
+    tracker.async_subscribe(recorder, [])
+    devices = [_device("a")]
+    _refresh(tracker, [], devices)
+
+    assert _refresh(tracker, devices, devices) == set()
+    assert len(recorder.events) == 1
+
+
+def test_removed_returned_and_forgotten() -> None:
+    """A known device comes back as returned, a forgotten one as added."""
+    tracker = lifecycle.DeviceLifecycle()
+    recorder = _Recorder()
+    tracker.async_subscribe(recorder, [])
+    a, b = _device("a"), _device("b")
+    _refresh(tracker, [], [a, b])
+
+    changed = _refresh(tracker, [a, b], [a])
+    assert recorder.events[-1].removed == ["b"]
+    assert changed == {("b", "id"), ("b", "enabled"), ("b", "powerLevel")}
+
+    _refresh(tracker, [a], [a, b])
+    assert recorder.events[-1].returned == [b]
+    assert recorder.events[-1].added == []
+
+    _refresh(tracker, [a, b], [a])
+    tracker.forget("b")
+    _refresh(tracker, [a], [a, b])
+    assert recorder.events[-1].added == [b]
+
+
+def test_subscribe_replays_present_devices() -> None:
+    """A late handler gets the present devices as added, and none after unsubscribing."""
+    tracker = lifecycle.DeviceLifecycle()
+    a, b = _device("a"), _device("b")
+    _refresh(tracker, [], [a, b])
+    _refresh(tracker, [a, b], [a])
+
+    recorder = _Recorder()
+    unsubscribe = tracker.async_subscribe(recorder, [a, b])
+    assert [events.added for events in recorder.events] == [[a]]
+
+    unsubscribe()
+    _refresh(tracker, [a], [a, b])
+    assert len(recorder.events) == 1
+
+
+def test_miners_appearing_and_disappearing_at_scale() -> None:
+    """Random churn in a large fleet yields the events and changes of a plain model."""
+    rng = random.Random(21)
+    tracker = lifecycle.DeviceLifecycle()
+    recorder = _Recorder()
+    tracker.async_subscribe(recorder, [])
+    fleet = [f"miner-{index}" for index in range(1000)]
+    known: set[str] = set()
+    present: dict[str, dict] = {}
+
+    for _ in range(100):
+        ids = {device_id for device_id in fleet if rng.random() < 0.9}
+        devices = []
+        expected_changed = set()
+        for device_id in sorted(ids):
+            old = present.get(device_id)
+            if old is not None and rng.random() < 0.95:
+                device = old
+            else:
+                device = _device(device_id, powerLevel=rng.randrange(5))
+                if old is None:
+                    expected_changed |= {(device_id, key) for key in device}
+                elif device["powerLevel"] != old["powerLevel"]:
+                    expected_changed.add((device_id, "powerLevel"))
+            devices.append(device)
+        gone = present.keys() - ids
+        for device_id in gone:
+            expected_changed |= {(device_id, key) for key in present[device_id]}
+        recorder.events.clear()
+
+        changed = _refresh(tracker, list(present.values()), devices)
+
+        events = recorder.events[0] if recorder.events else lifecycle.DeviceEvents()
+        assert changed == expected_changed
+        assert {device["id"] for device in events.added} == ids - known
+        assert {device["id"] for device in events.returned} == (ids & known) - present.keys()
+        assert set(events.removed) == gone
+        assert tracker.present == ids
+        known |= ids
+        present = {device["id"]: device for device in devices}
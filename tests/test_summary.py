@@ -0,0 +1,132 @@
+"""Tests of the status summary field tables."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+from . import integration_module, load_fixture
+from .summary_reference import parse_status_summary
+
+api = integration_module("api")
+summary = integration_module("summary")
+
+
+def _without(payload: dict, *path: str | int) -> dict:
+    """Return a copy of payload with the item at path removed."""
+    payload = copy.deepcopy(payload)
+    parent = payload
+    for step in path[:-1]:
+        parent = parent[step]
+    del parent[path[-1]]
+    return payload
+
+
+def _with(payload: dict, value: Any, *path: str | int) -> dict:
+    """Return a copy of payload with the item at path set to value."""
+    payload = copy.deepcopy(payload)
+    parent = payload
+    for step in path[:-1]:
+        parent = parent[step]
+    parent[path[-1]] = value
+    return payload
+
+
+V0_3 = load_fixture("summary_v0_3.json")
+V0_4 = load_fixture("summary_v0_4.json")
+_LAST = ("miningDevices", "lastSummaries", 0)
+
+PAYLOADS = {
+    "v0.3": V0_3,
+    "v0.3 without power": _without(V0_3, "power"),
+    "v0.3 stopped": _without(V0_3, "tunerStatus"),
+    "v0.4": V0_4,
+    "v0.4 without summaries": _without(V0_4, "miningDevices", "lastSummaries"),
+    "v0.4 without miner stats": _without(V0_4, *_LAST, "miner_stats"),
+    "v0.4 without power stats": _without(V0_4, *_LAST, "power_stats"),
+    "v0.4 without fans": _without(V0_4, *_LAST, "fans"),
+    "v0.4 without 24h hashrate": _without(
+        V0_4, *_LAST, "miner_stats", "real_hashrate", "last_24h"
+    ),
+    "v0.4 textual hashrate": {
+        **V0_4,
+        "miningDevices": {**V0_4["miningDevices"], "hashRate": "n/a"},
+    },
+    "v0.4 without best share": _without(V0_4, *_LAST, "pool_stats", "best_share"),
+    "v0.4 without chip temperature": _without(
+        V0_4, *_LAST, "highest_temperature", "temperature", "degree_c"
+    ),
+    "v0.4 without highest temperature": _without(V0_4, *_LAST, "highest_temperature"),
+    "v0.4 with empty pool stats": _with(V0_4, {}, *_LAST, "pool_stats"),
+    "v0.4 malformed share time": _with(
+        V0_4, {"seconds": "soon", "nanos": 0}, *_LAST, "pool_stats", "last_share_time"
+    ),
+    "v0.4 share time without nanos": _with(
+        V0_4, {"seconds": 1760689232}, *_LAST, "pool_stats", "last_share_time"
+    ),
+    "v0.4 share time without seconds": _with(
+        V0_4, {"nanos": 0}, *_LAST, "pool_stats", "last_share_time"
+    ),
+}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS.values(), ids=PAYLOADS.keys())
+def test_parse_matches_previous_parser(payload: dict) -> None:
+    """The field tables yield what the hand-written parser did."""
+    client = api.HeaterControlApiClient("heater.local")
+    assert client._parse_status_summary(payload) == parse_status_summary(payload)
+
+
+def test_forge_fields() -> None:
+    """Units are converted on the way."""
+    data = summary.FORGE_SUMMARY.parse(V0_4)
+    assert data["power_limit"] == 1200
+    assert data["power_consumption"] == 1132
+    assert data["hashrate_overall_mhs"] == 141520.0
+    assert data["hashrate_5s"] == 47301800.0
+    assert data["last_share_time_ms"] == 1760689232518
+    assert data["fan_rpms"] == [3120, 3090, 3150, 3075]
+
+
+def test_missing_pool_counters_and_temperature_are_none() -> None:
+    """Present pool stats and temperature report missing leaves as None."""
+    payload = _without(V0_4, *_LAST, "pool_stats", "best_share")
+    payload = _without(payload, *_LAST, "highest_temperature", "temperature", "degree_c")
+    data = summary.FORGE_SUMMARY.parse(payload)
+    assert data["best_share"] is None
+    assert data["highest_chip_temp_c"] is None
+
+
+def test_malformed_share_time_is_kept_raw() -> None:
+    """A share time that does not convert is stored unconverted."""
+    share_time = {"seconds": "soon", "nanos": 0}
+    data = summary.FORGE_SUMMARY.parse(
+        _with(V0_4, share_time, *_LAST, "pool_stats", "last_share_time")
+    )
+    assert "last_share_time_ms" not in data
+    assert data["last_share_time"] == share_time
+
+
+def test_rows_rejecting_their_value_are_skipped() -> None:
+    """A converter raising skips its row only."""
+    mapping = summary.SummaryMapping(
+        (
+            summary.SummaryField(("a",), "a", int),
+            summary.SummaryField(("b",), "b", int),
+        )
+    )
+    assert mapping.parse({"a": "x", "b": "2"}) == {"b": 2}
+
+
+def test_rows_applied_out_of_order_are_rejected() -> None:
+    """The later of two rows writing a key must also be applied later."""
+    with pytest.raises(ValueError):
+        summary.SummaryMapping(
+            (
+                summary.SummaryField(("a", "b"), "x"),
+                summary.SummaryField(("c",), "x"),
+                summary.SummaryField(("a", "d"), "x"),
+            )
+        )